@@ -22,13 +22,13 @@ from config import (
     RANKING_VIEW_MAPPING,
     SUPPORTED_YEARS,
 )
-from dashboard import create_dashboard
+from dashboard import create_dashboard, stream_voting_insight
 from feedback import FeedbackSubmitter
 from settings import settings
-from theme import CUSTOM_CSS, THEME
+from theme import CUSTOM_CSS, get_theme
 
 # ---------- Gradio UI (UI-only, imports functionality from modules) ----------
-with gr.Blocks(title="What was the year about - music chart", theme=THEME, css=CUSTOM_CSS) as demo:
+with gr.Blocks(title="What was the year about - music chart", theme=get_theme(), css=CUSTOM_CSS) as demo:
     # Hero section with optional image
     with gr.Column(elem_classes=["hero"]):
         gr.Image(value=str(HEADER_IMAGE), show_label=False, height=300)
@@ -200,7 +200,8 @@ with gr.Blocks(title="What was the year about - music chart", theme=THEME, css=C
     def refresh_with_email(year, email_prefix, ranking_view_choice):
         """Wrapper to pass year, email and ranking view selector to create_dashboard."""
         view_key = RANKING_VIEW_MAPPING.get(ranking_view_choice, "overlay")
-        dashboard_data = create_dashboard(email_prefix, ranking_view=view_key, year=year)
+        # The LLM insight is streamed into the overview afterwards (see stream_insight)
+        dashboard_data = create_dashboard(email_prefix, ranking_view=view_key, year=year, include_insight=False)
         results = dashboard_data.to_tuple()
 
         # Hide warnings if email is provided and has data
@@ -226,10 +227,14 @@ with gr.Blocks(title="What was the year about - music chart", theme=THEME, css=C
     def refresh_main_chart_only(year, email_prefix, ranking_view_choice):
         """Refresh only the main chart when ranking view changes."""
         view_key = RANKING_VIEW_MAPPING.get(ranking_view_choice, "overlay")
-        dashboard_data = create_dashboard(email_prefix, ranking_view=view_key, year=year)
+        dashboard_data = create_dashboard(email_prefix, ranking_view=view_key, year=year, include_insight=False)
         all_results = dashboard_data.to_tuple()
         return all_results[5]  # main_plot is the 6th item (index 5)
 
+    def stream_insight(overview_text, email_prefix, year):
+        """Append the LLM voting insight to the rendered overview as it is generated."""
+        yield from stream_voting_insight(overview_text, email_prefix, year)
+
     # Wire up refresh with email
     all_outputs = [
         hero_title,  # Add hero_title as first output
@@ -260,7 +265,7 @@ with gr.Blocks(title="What was the year about - music chart", theme=THEME, css=C
         refresh_with_email,
         inputs=[year_selector, email_input, ranking_view],
         outputs=all_outputs,
-    )
+    ).then(stream_insight, inputs=[overview, email_input, year_selector], outputs=overview)
 
     # Auto-refresh only main chart when ranking view changes
     ranking_view.change(
@@ -274,14 +279,14 @@ with gr.Blocks(title="What was the year about - music chart", theme=THEME, css=C
         refresh_with_email,
         inputs=[year_selector, email_input, ranking_view],
         outputs=all_outputs,
-    )
+    ).then(stream_insight, inputs=[overview, email_input, year_selector], outputs=overview)
 
     # Year selector triggers refresh too
     year_selector.change(
         refresh_with_email,
         inputs=[year_selector, email_input, ranking_view],
         outputs=all_outputs,
-    )
+    ).then(stream_insight, inputs=[overview, email_input, year_selector], outputs=overview)
 
     # Initial load with empty email and default year
     demo.load(
@@ -3,10 +3,28 @@ Caching with Time-To-Live (TTL) support.
 Replaces @lru_cache with granular control over cache expiration.
 """
 
+import hashlib
+import pickle
+import time
+import warnings
 from collections.abc import Callable
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Generic, TypeVar
 
+import pandas as pd
+
+try:
+    import pyarrow  # type: ignore
+
+    PARQUET_AVAILABLE = True
+    # Filesystem failures, plus pyarrow's own errors for frames it cannot write
+    _DISK_WRITE_ERRORS: tuple[type[Exception], ...] = (OSError, pyarrow.ArrowException)
+except Exception:
+    # Without pyarrow the disk cache falls back to pickle files
+    PARQUET_AVAILABLE = False
+    _DISK_WRITE_ERRORS = (OSError, pickle.PicklingError)
+
 T = TypeVar("T")
 
 
@@ -68,6 +86,25 @@ class CachedDataLoader(Generic[T]):
         self.cache[key] = (data, datetime.now())
         return data
 
+    def peek(self, key: tuple, default: T | None = None) -> T | None:
+        """
+        Return the cached value for key without loading it on a miss.
+
+        Args:
+            key: Cache key (typically tuple of function arguments)
+            default: Value returned if key is missing or expired
+
+        Returns:
+            Cached value, or default
+        """
+        if key in self.cache:
+            data, timestamp = self.cache[key]
+            if datetime.now() - timestamp < self.ttl:
+                self.hits += 1
+                return data
+            del self.cache[key]
+        return default
+
     def clear(self):
         """Clear all cached items."""
         self.cache.clear()
@@ -100,6 +137,74 @@ class CachedDataLoader(Generic[T]):
         }
 
 
+class DiskDataFrameCache:
+    """
+    File-backed TTL cache for DataFrames that survives process restarts.
+
+    Each key is stored as one Parquet file (pickle if pyarrow is missing) and
+    expires based on the file's modification time, so a cold start can reuse a
+    recent Google Sheets fetch instead of going over the network again.
+    """
+
+    def __init__(self, directory: Path, ttl_seconds: int = 3600):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Folder for cache files (created on first write)
+            ttl_seconds: Time-to-live for cached DataFrames in seconds (default 1 hour)
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.suffix = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}{self.suffix}"
+
+    def get(self, key: str, loader_fn: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return the cached DataFrame for key, or compute, store and return it.
+
+        Args:
+            key: Cache key (e.g. spreadsheet name)
+            loader_fn: Callable that fetches the DataFrame if not cached
+
+        Returns:
+            Cached or freshly loaded DataFrame
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime < self.ttl_seconds:
+                return pd.read_parquet(path, memory_map=True) if PARQUET_AVAILABLE else pd.read_pickle(path)
+        except Exception:
+            # Missing, expired-and-removed or unreadable file: treat as a miss
+            pass
+
+        data = loader_fn()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if PARQUET_AVAILABLE:
+                data.to_parquet(path, compression="zstd")
+            else:
+                data.to_pickle(path)
+        except _DISK_WRITE_ERRORS as e:
+            # The fresh data is still returned; the next cold start just fetches again
+            warnings.warn(f"Failed to write disk cache {path}: {e}", RuntimeWarning, stacklevel=2)
+        return data
+
+    def invalidate(self, key: str | None = None):
+        """
+        Delete a cached entry, or every entry when key is None.
+
+        Args:
+            key: Cache key to invalidate. If None, clears the whole cache directory.
+        """
+        paths = [self._path(key)] if key is not None else list(self.directory.glob(f"*{self.suffix}"))
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
 # Convenience function for decorator-style usage
 def cached_operation(cache_instance: CachedDataLoader, *args, **kwargs):
     """
@@ -19,6 +19,12 @@ LEGACY_SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/1ggWt0Pbpb47qR8
 SUPPORTED_YEARS = [2024, 2023, 2019]
 DEFAULT_YEAR = 2024
 
+# HTTP connection pool for the shared gspread client (keep-alive + retries)
+SHEETS_POOL_CONNECTIONS = 4
+SHEETS_POOL_MAXSIZE = 8
+SHEETS_MAX_RETRIES = 3
+SHEETS_RETRY_BACKOFF = 0.2
+
 # ============================================================================
 # UI CONFIGURATION
 # ============================================================================
@@ -54,6 +60,11 @@ LLM_MODELS = {
     },
 }
 
+# Shared Groq HTTP client pool
+GROQ_MAX_KEEPALIVE_CONNECTIONS = 8
+GROQ_MAX_CONNECTIONS = 16
+GROQ_TIMEOUT_SECONDS = 30
+
 # ============================================================================
 # CONSTRAINTS & LIMITS
 # ============================================================================
@@ -61,9 +72,20 @@ LLM_MODELS = {
 LLM_ANALYSIS_MIN_WORDS = 250
 LLM_ANALYSIS_MAX_WORDS = 300
 LLM_RECOMMENDATION_COUNT = 5
+SINGLE_RECOMMENDATION_MAX_TOKENS = 160  # per-call budget for one JSON-mode recommendation
+RECOMMENDATION_MAX_WORKERS = 5  # concurrent Groq calls for recommendations
+
+# Voting analysis prompt inputs
+TOP_DISAGREEMENTS_COUNT = 3
+TOP_SONGS_COUNT = 3
+SIGNIFICANT_DIFFERENCE_THRESHOLD = 1  # points away from the average
 
 CACHE_MAX_SIZE = 10
 CACHE_TTL_SECONDS = 3600  # 1 hour
+FIGURE_CACHE_MAX_SIZE = 64  # built charts, shared across the ~16 visuals builders
+FRAME_DIGEST_MEMO_SIZE = 8  # content hashes remembered per DataFrame object (df_raw, avg_scores, ...)
+VOTE_STATS_CACHE_MAX_SIZE = 4  # parsed vote matrices, one per distinct responses sheet
+SCATTERGL_MIN_POINTS = 1000  # taste-map voters above which scatter traces render via WebGL
 
 # ============================================================================
 # DATA PROCESSING
@@ -83,6 +105,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SRC_DIR = Path(__file__).resolve().parent
 CREDENTIALS_PATH = BASE_DIR / "credentials.json"
 FEEDBACK_LOG_PATH = BASE_DIR / "feedback_log.txt"
+CACHE_DIR = BASE_DIR / ".cache"
 STATIC_DIR = BASE_DIR / "static"
 HEADER_IMAGE = STATIC_DIR / "header.png"
 
@@ -0,0 +1,22 @@
+# Shared fixtures for the src/test_*.py suites
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+SRC = Path(__file__).resolve().parent
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture
+def authenticated_client(monkeypatch):
+    """Stand in for load_data.authenticate and return the fake gspread client it hands out."""
+    import load_data
+
+    client = MagicMock()
+    monkeypatch.setattr(load_data, "authenticate", lambda: client)
+    load_data._sheet_location.cache_clear()
+    yield client
+    load_data._sheet_location.cache_clear()
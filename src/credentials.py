@@ -1,18 +1,49 @@
 """
 Centralized Google Sheets authentication.
 Implements 3-tier fallback for credential loading.
+
+The authenticated client is built once per process and reused, so repeated
+fetches share one keep-alive HTTP connection pool instead of re-reading
+credentials and opening a fresh TLS connection every time.
 """
 
 import json
 import os
 
 import gspread
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config import CREDENTIALS_PATH
+from config import (
+    CREDENTIALS_PATH,
+    SHEETS_MAX_RETRIES,
+    SHEETS_POOL_CONNECTIONS,
+    SHEETS_POOL_MAXSIZE,
+    SHEETS_RETRY_BACKOFF,
+)
 from exceptions import CredentialsError
 
+# Process-wide authenticated client (see authenticate / reset_client)
+_GC_SINGLETON: gspread.Client | None = None
 
-def authenticate() -> gspread.Client:
+
+def _configure_session(gc: gspread.Client) -> None:
+    """Mount a pooled, retrying HTTP adapter on the client's session."""
+    http_client = getattr(gc, "http_client", None)
+    session = getattr(http_client, "session", None)
+    if session is None or not hasattr(session, "mount"):
+        return
+
+    adapter = HTTPAdapter(
+        pool_connections=SHEETS_POOL_CONNECTIONS,
+        pool_maxsize=SHEETS_POOL_MAXSIZE,
+        max_retries=Retry(total=SHEETS_MAX_RETRIES, backoff_factor=SHEETS_RETRY_BACKOFF),
+    )
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+
+
+def _build_client() -> gspread.Client:
     """
     Authenticate with Google Sheets using 3-tier fallback.
 
@@ -66,3 +97,30 @@ def authenticate() -> gspread.Client:
         "Set 'GOOGLE_SHEETS_CREDENTIALS' environment variable (JSON content) "
         "or place credentials.json in project root."
     )
+
+
+def authenticate() -> gspread.Client:
+    """
+    Return the shared authenticated Google Sheets client.
+
+    The client is built on first use (see _build_client for the credential
+    fallback order) and reused for the lifetime of the process.
+
+    Returns:
+        gspread.Client: Authenticated Google Sheets client
+
+    Raises:
+        CredentialsError: If no valid credentials found or authentication fails
+    """
+    global _GC_SINGLETON
+    if _GC_SINGLETON is None:
+        gc = _build_client()
+        _configure_session(gc)
+        _GC_SINGLETON = gc
+    return _GC_SINGLETON
+
+
+def reset_client() -> None:
+    """Drop the shared client so the next authenticate() call rebuilds it."""
+    global _GC_SINGLETON
+    _GC_SINGLETON = None
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 import pandas as pd
 import plotly.express as px  # noqa: F401
 from nicegui import ui  # noqa: F401
@@ -8,6 +10,7 @@ from llm_implementation import (
     MODEL_JSON,
     generate_recommendations,
     get_user_voting_insight,
+    get_user_voting_insight_stream,
 )
 from models import DashboardData
 from visuals import (
@@ -27,13 +30,26 @@ from visuals import (
 )
 
 
-def create_dashboard(user_email_prefix: str = "", ranking_view: str = "overlay", year: int = 2024):
+def _insight_section(insight: str) -> str:
+    """Markdown appended to the overview for the LLM voting insight."""
+    # Plain-size label, plus model info note
+    return (
+        f"\n\n**Your Voting Pattern (LLM-generated):**\n{insight}\n"
+        f"\n<span class='model-note'>Generated with <code>{MODEL_ANALYSIS}</code> on Groq</span>"
+    )
+
+
+def create_dashboard(
+    user_email_prefix: str = "", ranking_view: str = "overlay", year: int = 2024, include_insight: bool = True
+):
     """Generate all dashboard components with optional user comparison.
 
     Args:
         user_email_prefix: User's email prefix for personalized data
         ranking_view: one of "overlay" (avg + your scores), "user" (only your scores), or "average" (only group average)
         year: Year to display data for (2019, 2023, or 2024)
+        include_insight: Wait for the LLM voting insight and append it to the overview.
+            Pass False when stream_voting_insight fills it in afterwards.
     """
     df_raw, avg_scores, total_votes, avg_of_avgs, total_songs, error, comparison = get_data_cached(
         user_email_prefix, year
@@ -164,13 +180,9 @@ Stats: {total_votes} votes  •  {total_songs} songs  •  Average: {avg_of_avgs
     if comparison is not None and not comparison.empty:
         comparison_display = comparison.round(2)
         # Get LLM insight about voting patterns
-        insight = get_user_voting_insight(comparison)
+        insight = get_user_voting_insight(comparison) if include_insight else ""
         if insight:
-            # Plain-size label, plus model info note
-            overview = overview + (
-                f"\n\n**Your Voting Pattern (LLM-generated):**\n{insight}\n"
-                f"\n<span class='model-note'>Generated with <code>{MODEL_ANALYSIS}</code> on Groq</span>"
-            )
+            overview = overview + _insight_section(insight)
 
         # Generate user-specific charts
         disagreements_chart = make_biggest_disagreements_chart(comparison)
@@ -229,6 +241,29 @@ Stats: {total_votes} votes  •  {total_songs} songs  •  Average: {avg_of_avgs
     )
 
 
+def stream_voting_insight(overview: str, user_email_prefix: str = "", year: int = 2024) -> Iterator[str]:
+    """Yield overview with the LLM voting insight appended as it streams in.
+
+    Pairs with create_dashboard(..., include_insight=False): the dashboard renders
+    without waiting for the LLM and this generator fills the insight in afterwards.
+
+    Args:
+        overview: Overview markdown produced by create_dashboard
+        user_email_prefix: User's email prefix for personalized data
+        year: Year to display data for (2019, 2023, or 2024)
+    """
+    if not user_email_prefix:
+        return
+
+    *_, error, comparison = get_data_cached(user_email_prefix, year)
+    if error or comparison is None or comparison.empty:
+        return
+
+    for insight in get_user_voting_insight_stream(comparison):
+        if insight:
+            yield overview + _insight_section(insight)
+
+
 # Playing around and experimenting with the NiceGUI framework
 
 
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 from cache import CachedDataLoader
-from load_data import fetch_data
+from load_data import SHEET_CACHE, fetch_data_cached
 from settings import settings
 
 try:
@@ -133,15 +133,30 @@ def _load_year_df(year: int) -> pd.DataFrame:
     - 2019/2023: load legacy sheet and standardize to 2024-like format.
     """
     if year == 2024:
-        return fetch_data(2024)
+        return fetch_data_cached(2024)
     elif year in (2019, 2023):
-        raw = fetch_data(year)
+        raw = fetch_data_cached(year)
         std = _standardize_legacy_votes(raw, year)
         return std if not std.empty else pd.DataFrame()
     else:
         raise ValueError("Unsupported year")
 
 
+def _email_prefix_mask(emails: pd.Series, email_prefix: str) -> pd.Series:
+    """Boolean mask of rows whose email, before the '@', equals email_prefix (case-insensitive).
+
+    Equivalent to ``emails.str.lower().str.split("@").str[0] == prefix`` but stays in
+    vectorized string kernels instead of building a Python list per row.
+    """
+    prefix = email_prefix.lower()
+    if "@" in prefix:
+        # A split-off prefix can never contain '@'
+        return pd.Series(False, index=emails.index)
+    lowered = emails.str.lower()
+    mask = (lowered == prefix) | lowered.str.startswith(prefix + "@", na=False)
+    return mask.fillna(False).astype(bool)
+
+
 def get_user_votes(df: pd.DataFrame | None, email_prefix: str) -> tuple[pd.DataFrame, str | None]:
     """Get votes for a specific user by their email prefix.
 
@@ -156,7 +171,7 @@ def get_user_votes(df: pd.DataFrame | None, email_prefix: str) -> tuple[pd.DataF
         return pd.DataFrame(), "No data available"
 
     # Find row where Email address column matches the prefix
-    user_row = df[df["Email address"].str.lower().str.split("@").str[0] == email_prefix.lower()]
+    user_row = df[_email_prefix_mask(df["Email address"], email_prefix)]
 
     if user_row.empty:
         return pd.DataFrame(), f"No votes found for {email_prefix}"
@@ -263,7 +278,7 @@ def calculate_taste_similarity(df: pd.DataFrame | None, email_prefix: str) -> pd
     df_numeric = df[song_cols].apply(pd.to_numeric, errors="coerce")
 
     # Find user's row
-    user_mask = df["Email address"].str.lower().str.split("@").str[0] == email_prefix.lower()
+    user_mask = _email_prefix_mask(df["Email address"], email_prefix)
     if not user_mask.any():
         return pd.DataFrame(columns=["Voter", "Similarity Score", "Songs in Common"])
 
@@ -526,6 +541,7 @@ def refresh_data():
     We import create_dashboard locally to avoid a circular import at module import time.
     """
     DATA_CACHE.clear()
+    SHEET_CACHE.invalidate()
     from dashboard import create_dashboard
 
     return create_dashboard()
@@ -1,9 +1,48 @@
+import ast
+import json
+import re
+import threading
+import warnings
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import numpy as np
 import pandas as pd
-
-from config import DEFAULT_YEAR, SPREADSHEET_CONFIG
-from credentials import authenticate
+from pydantic_core import from_json
+
+try:
+    from groq import Groq
+except ImportError:
+    # LLM features are disabled without the groq package
+    Groq = None
+
+try:
+    import orjson  # type: ignore
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so except clauses are unchanged
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is optional; LLM JSON replies are parsed with the stdlib json module without it
+    _json_loads = json.loads
+
+from cache import CachedDataLoader
+from config import (
+    DEFAULT_YEAR,
+    GROQ_MAX_CONNECTIONS,
+    GROQ_MAX_KEEPALIVE_CONNECTIONS,
+    GROQ_TIMEOUT_SECONDS,
+    RECOMMENDATION_MAX_WORKERS,
+    SIGNIFICANT_DIFFERENCE_THRESHOLD,
+    SINGLE_RECOMMENDATION_MAX_TOKENS,
+    TOP_DISAGREEMENTS_COUNT,
+    TOP_SONGS_COUNT,
+)
+from exceptions import LLMError
+from load_data import fetch_data
 from prompt_templates import (
     render_recommendations_prompt,
+    render_single_recommendation_prompt,
     render_song_blurb_prompt,
     render_voting_analysis_prompt,
 )
@@ -21,124 +60,273 @@ MODEL_JSON = settings.model_json
 # Legacy single-model env for backward compatibility
 GROQ_MODEL = settings.groq_model or MODEL_BLURB
 
+# Prefix of the string call_groq returns when the API call fails
+GROQ_ERROR_PREFIX = "Error generating response:"
+
+# Voting analysis output is wrapped in these tags; the end tag doubles as a stop sequence
+ANALYSIS_START_TAG = "<analysis>"
+ANALYSIS_END_TAG = "</analysis>"
+
+# Start of a JSON array whose first element is an object
+_ARRAY_OF_OBJECTS_START = re.compile(r"\[\s*\{")
+
+# JSON keywords outside string literals, and their Python spellings (see _lenient_loads)
+_JSON_KEYWORDS = re.compile(r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|\b(true|false|null)\b""")
+_PY_LITERALS = {"true": "True", "false": "False", "null": "None"}
+
+# Characters that end a finished sentence
+_SENTENCE_END = (".", "!", "?", "\u2026")
+
+# Completed voting analyses keyed by rendered prompt
+ANALYSIS_CACHE = CachedDataLoader(
+    ttl_seconds=settings.cache_ttl_seconds,
+    max_size=settings.cache_max_size,
+)
+
+# Characters in song names that break the JSON in recommendation prompts
+_SANITIZE_TABLE = str.maketrans({"\\": "/", "\n": " ", "\r": " "})
+
+# Process-wide Groq client; its httpx pool keeps connections alive between calls
+_GROQ_CLIENT = None
+# Serializes the first build, which can happen inside concurrent recommendation calls
+_GROQ_CLIENT_LOCK = threading.Lock()
+
+# Models that rejected response_format=json_object; recommendations go straight to the batched prompt
+_JSON_MODE_UNSUPPORTED: set[str] = set()
+
+
+def _get_groq_client():
+    """Return the shared Groq client, building it on first use."""
+    global _GROQ_CLIENT
+    if _GROQ_CLIENT is not None:
+        return _GROQ_CLIENT
+    with _GROQ_CLIENT_LOCK:
+        if _GROQ_CLIENT is not None:
+            return _GROQ_CLIENT
+        if Groq is None:
+            raise LLMError("groq package is not installed")
+        http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_keepalive_connections=GROQ_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=GROQ_MAX_CONNECTIONS,
+            ),
+            timeout=GROQ_TIMEOUT_SECONDS,
+        )
+        _GROQ_CLIENT = Groq(api_key=GROQ_API_KEY, http_client=http_client)
+    return _GROQ_CLIENT
+
 
 def fetch_df() -> pd.DataFrame:
-    """Fetch Google Sheet into a DataFrame.
+    """Fetch the current year's Google Sheet into a DataFrame.
 
-    Prefers credentials from the GOOGLE_SHEETS_CREDENTIALS env var (JSON string)
-    for platforms like Hugging Face Spaces. Falls back to credentials.json file
-    in the project root if the env var is not provided or parsing fails.
+    Delegates to load_data.fetch_data so there is a single Sheets loading path
+    (shared authenticated client, header sanitizing, numeric score columns).
     """
-    gc = authenticate()
-    sh = gc.open(SPREADSHEET_CONFIG[DEFAULT_YEAR]).sheet1
-    return pd.DataFrame(sh.get_all_records())
+    return fetch_data(DEFAULT_YEAR)
 
 
 def get_top_song(df: pd.DataFrame, meta_cols: int = 2) -> tuple[str, float]:
     # assumes first 2 columns are metadata (Timestamp, Email); ratings follow
-    song_cols = list(df.columns[meta_cols:])
-    ratings = df[song_cols].apply(pd.to_numeric, errors="coerce")
-    means = ratings.mean(skipna=True).dropna()
-    if means.empty:
+    song_cols = df.columns[meta_cols:]
+    # Single float64 matrix; NaN for blanks so nanmean skips them (like mean(skipna=True))
+    block = df[song_cols]
+    if all(pd.api.types.is_numeric_dtype(t) for t in block.dtypes):
+        # Already numeric after load_data's score coercion: no conversion pass at all
+        ratings = block.to_numpy(dtype=np.float64)
+    else:
+        # one to_numeric over the flattened block instead of a per-column loop
+        flat = pd.Series(block.to_numpy().ravel())
+        ratings = pd.to_numeric(flat, errors="coerce").to_numpy(dtype=np.float64).reshape(block.shape)
+    if ratings.size == 0 or np.isnan(ratings).all():
         raise ValueError("No numeric ratings found in the sheet.")
-    top_song = str(means.idxmax())
-    top_score = float(means.max())
-    return top_song, top_score
+    with warnings.catch_warnings():
+        # All-NaN columns produce a "Mean of empty slice" warning; nanargmax skips them
+        warnings.simplefilter("ignore", RuntimeWarning)
+        means = np.nanmean(ratings, axis=0)
+    idx = int(np.nanargmax(means))
+    return str(song_cols[idx]), float(means[idx])
 
 
 def make_prompt(song: str, avg: float) -> str:
     return render_song_blurb_prompt(song_name=song, avg_score=avg)
 
 
-def analyze_user_votes(comparison_df: pd.DataFrame) -> str:
-    """Analyze how a user's votes differ from the average and generate a summary."""
-    if comparison_df.empty:
-        return ""
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, largest first.
 
-    # Sort by absolute difference to find most significant disagreements
-    comparison_df = comparison_df.copy()
-    comparison_df["Abs_Diff"] = abs(comparison_df["Difference"])
-    significant_diffs = comparison_df.nlargest(3, "Abs_Diff")
+    Matches DataFrame.nlargest(k, col): ties keep their original order and NaNs only fill
+    the tail when there are fewer than k real values.
+    """
+    nan_mask = np.isnan(values)
+    valid = np.flatnonzero(~nan_mask)
+    order = valid[np.argsort(-values[valid], kind="stable")]
+    return np.concatenate([order, np.flatnonzero(nan_mask)])[:k]
 
-    # Find their top rated songs vs overall top rated
-    user_top = comparison_df.nlargest(3, "Your Score")
-    overall_top = comparison_df.nlargest(3, "Average Score")
 
-    # Find general voting pattern
-    comparison_df["Difference"].mean()
-    higher_count = (comparison_df["Difference"] > 1).sum()
-    lower_count = (comparison_df["Difference"] < -1).sum()
-
-    # Create prompt for LLM using templates
-    # Find biggest positive and negative differences
-    biggest_over = (
-        significant_diffs[significant_diffs["Difference"] > 0].iloc[0]
-        if not significant_diffs[significant_diffs["Difference"] > 0].empty
-        else None
-    )
-    biggest_under = (
-        significant_diffs[significant_diffs["Difference"] < 0].iloc[0]
-        if not significant_diffs[significant_diffs["Difference"] < 0].empty
-        else None
-    )
+def _build_analysis_prompt(comparison_df: pd.DataFrame) -> str:
+    """Render the voting analysis prompt from a non-empty comparison DataFrame."""
+    # Pull the columns out once; everything below works on plain float arrays
+    songs = comparison_df["Song"].to_numpy()
+    your = comparison_df["Your Score"].to_numpy(dtype=np.float64)
+    avg = comparison_df["Average Score"].to_numpy(dtype=np.float64)
+    diff = comparison_df["Difference"].to_numpy(dtype=np.float64)
 
-    biggest_over_data = None
-    if biggest_over is not None:
-        biggest_over_data = {
-            "song": biggest_over["Song"],
-            "score": float(biggest_over["Your Score"]),
-            "avg_score": float(biggest_over["Average Score"]),
-        }
-
-    biggest_under_data = None
-    if biggest_under is not None:
-        biggest_under_data = {
-            "song": biggest_under["Song"],
-            "score": float(biggest_under["Your Score"]),
-            "avg_score": float(biggest_under["Average Score"]),
-        }
-
-    disagreements = [
-        (
-            row["Song"],
-            float(row["Your Score"]),
-            float(row["Average Score"]),
-            float(row["Difference"]),
+    # Most significant disagreements, then their top rated songs vs overall top rated
+    disagree_idx = _top_k_indices(np.abs(diff), TOP_DISAGREEMENTS_COUNT)
+    user_top_idx = _top_k_indices(your, TOP_SONGS_COUNT)
+    overall_top_idx = _top_k_indices(avg, TOP_SONGS_COUNT)
+
+    # Find general voting pattern
+    higher_count = int((diff > SIGNIFICANT_DIFFERENCE_THRESHOLD).sum())
+    lower_count = int((diff < -SIGNIFICANT_DIFFERENCE_THRESHOLD).sum())
+
+    # Find biggest positive and negative differences among the disagreements
+    def song_data(i: int) -> dict:
+        return {"song": songs[i], "score": float(your[i]), "avg_score": float(avg[i])}
+
+    biggest_over_data = next((song_data(i) for i in disagree_idx if diff[i] > 0), None)
+    biggest_under_data = next((song_data(i) for i in disagree_idx if diff[i] < 0), None)
+
+    disagreements = list(
+        zip(
+            songs[disagree_idx].tolist(),
+            your[disagree_idx].tolist(),
+            avg[disagree_idx].tolist(),
+            diff[disagree_idx].tolist(),
+            strict=True,
         )
-        for _, row in significant_diffs.iterrows()
-    ]
+    )
 
-    prompt = render_voting_analysis_prompt(
+    return render_voting_analysis_prompt(
         biggest_over=biggest_over_data,
         biggest_under=biggest_under_data,
-        top_user_songs=user_top["Song"].tolist(),
-        top_community_songs=overall_top["Song"].tolist(),
-        higher_count=int(higher_count),
-        lower_count=int(lower_count),
+        top_user_songs=songs[user_top_idx].tolist(),
+        top_community_songs=songs[overall_top_idx].tolist(),
+        higher_count=higher_count,
+        lower_count=lower_count,
         disagreements=disagreements,
     )
 
-    # Use the long-form analysis model as recommended
-    # Request a longer output and auto-finish if the model cuts mid-sentence
-    analysis = call_groq(prompt, MODEL_ANALYSIS, temperature=0.5, max_tokens=900)
 
-    def is_complete(text: str) -> bool:
-        t = text.strip()
-        return len(t) > 0 and t[-1] in ".!?\u2026"  # ends with sentence punctuation
+def analyze_user_votes(comparison_df: pd.DataFrame) -> str:
+    """Analyze how a user's votes differ from the average and generate a summary."""
+    if comparison_df.empty:
+        return ""
 
-    if not is_complete(analysis):
-        tail = call_groq(
-            (
-                "Continue and finish the above analysis cleanly in the same tone. "
-                "Do not repeat prior lines; add 2–3 concluding sentences.\n\n"
-                f"Previous text:\n{analysis}\n"
-            ),
+    prompt = _build_analysis_prompt(comparison_df)
+
+    # Completed analyses are cached per prompt so a replay never pays for the tail call again;
+    # text from a run where any Groq call failed is returned once and then dropped
+    analysis, ok = ANALYSIS_CACHE.get((prompt,), lambda: _generate_analysis(prompt))
+    if not ok:
+        ANALYSIS_CACHE.invalidate((prompt,))
+    return analysis
+
+
+def _is_text_complete(text: str) -> bool:
+    """Check whether text ends with sentence punctuation."""
+    # rstrip only copies when there is trailing whitespace; leading text is never touched
+    return text.rstrip().endswith(_SENTENCE_END)
+
+
+def _strip_analysis_tags(text: str) -> str:
+    """Remove the <analysis>...</analysis> wrapper the prompt asks the model to use."""
+    return text.replace(ANALYSIS_START_TAG, "").replace(ANALYSIS_END_TAG, "").strip()
+
+
+def _continuation_prompt(analysis: str) -> str:
+    """Prompt asking the model to finish an analysis that was cut off mid-sentence."""
+    return (
+        "Continue and finish the above analysis cleanly in the same tone. "
+        "Do not repeat prior lines; add 2–3 concluding sentences.\n\n"
+        f"Previous text:\n{analysis}\n"
+    )
+
+
+def _generate_analysis(prompt: str) -> tuple[str, bool]:
+    """Run the long-form analysis call, finishing it with a tail call only if it was cut off.
+
+    Returns:
+        (analysis, ok) where ok is False if any Groq call failed. A failed first call
+        returns its error message; a failed tail call returns the text generated so far.
+    """
+    # Use the long-form analysis model as recommended. The prompt asks for a closing
+    # sentence inside <analysis> tags and we stop on the end tag, so one call normally
+    # yields a complete text; the budget leaves room for that closing sentence.
+    analysis, finish_reason = _call_groq_with_reason(
+        prompt, MODEL_ANALYSIS, temperature=0.5, max_tokens=1200, stop=[ANALYSIS_END_TAG]
+    )
+    if analysis.startswith(GROQ_ERROR_PREFIX):
+        return analysis, False
+    analysis = _strip_analysis_tags(analysis)
+
+    # Only a response cut off by max_tokens needs finishing; text that merely ends in a
+    # quote or dash after a natural stop is left alone. A truncated tail gets one more,
+    # shorter attempt.
+    for tail_tokens in (240, 120):
+        if finish_reason != "length" or _is_text_complete(analysis):
+            break
+        tail, finish_reason = _call_groq_with_reason(
+            _continuation_prompt(analysis),
             MODEL_ANALYSIS,
             temperature=0.5,
-            max_tokens=240,
+            max_tokens=tail_tokens,
         )
+        if tail.startswith(GROQ_ERROR_PREFIX):
+            return analysis, False
         analysis = (analysis.strip() + " " + tail.strip()).strip()
-    return analysis
+    return analysis, True
+
+
+def _completion_kwargs(
+    prompt: str,
+    model: str | None,
+    temperature: float | None,
+    max_tokens: int | None,
+    stop: list[str] | None,
+    response_format: dict | None = None,
+) -> dict:
+    """Build chat.completions.create arguments shared by the blocking and streaming calls."""
+    kwargs = {
+        # Select model with sensible defaults based on env or provided override
+        "model": model or GROQ_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.7 if temperature is None else float(temperature),
+        "max_tokens": 500 if max_tokens is None else int(max_tokens),
+        "top_p": 1,
+        "stop": stop,
+    }
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+    return kwargs
+
+
+def _call_groq_with_reason(
+    prompt: str,
+    model: str | None = None,
+    *,
+    temperature: float | None = None,
+    max_tokens: int | None = None,
+    stop: list[str] | None = None,
+    response_format: dict | None = None,
+) -> tuple[str, str | None]:
+    """call_groq that also returns the API finish_reason ("stop", "length", ...).
+
+    finish_reason is None when LLM features are disabled or the call failed.
+    """
+    if not LLM_ENABLED:
+        # LLM features disabled when no API key is configured; return empty
+        # string so callers can decide how to render the absence of content.
+        return "", None
+    try:
+        resp = _get_groq_client().chat.completions.create(
+            **_completion_kwargs(prompt, model, temperature, max_tokens, stop, response_format)
+        )
+        choice = resp.choices[0]
+        content = choice.message.content
+        return (content.strip() if content else "No response generated"), choice.finish_reason
+    except Exception as e:
+        return f"{GROQ_ERROR_PREFIX} {str(e)}", None
 
 
 def call_groq(
@@ -147,29 +335,46 @@ def call_groq(
     *,
     temperature: float | None = None,
     max_tokens: int | None = None,
+    stop: list[str] | None = None,
+    response_format: dict | None = None,
 ) -> str:
-    try:
-        if not LLM_ENABLED:
-            # LLM features disabled when no API key is configured; return empty
-            # string so callers can decide how to render the absence of content.
-            return ""
-        from groq import Groq
+    content, _finish_reason = _call_groq_with_reason(
+        prompt,
+        model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stop=stop,
+        response_format=response_format,
+    )
+    return content
 
-        client = Groq(api_key=GROQ_API_KEY)
-        # Select model with sensible defaults based on env or provided override
-        _model = model or GROQ_MODEL
-        resp = client.chat.completions.create(
-            model=_model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7 if temperature is None else float(temperature),
-            max_tokens=500 if max_tokens is None else int(max_tokens),
-            top_p=1,
-            stop=None,
+
+def _stream_groq_with_reason(
+    prompt: str,
+    model: str | None = None,
+    *,
+    temperature: float | None = None,
+    max_tokens: int | None = None,
+    stop: list[str] | None = None,
+) -> Iterator[tuple[str, str | None]]:
+    """Streaming _call_groq_with_reason: yields (delta, finish_reason) as chunks arrive.
+
+    finish_reason is None until the final chunk reports it. Yields nothing when LLM
+    features are disabled; on API failure the error message is yielded as a last
+    (text, None) pair, the same text call_groq would return.
+    """
+    if not LLM_ENABLED:
+        return
+    try:
+        stream = _get_groq_client().chat.completions.create(
+            **_completion_kwargs(prompt, model, temperature, max_tokens, stop), stream=True
         )
-        content = resp.choices[0].message.content
-        return content.strip() if content else "No response generated"
+        for chunk in stream:
+            if chunk.choices:
+                choice = chunk.choices[0]
+                yield choice.delta.content or "", choice.finish_reason
     except Exception as e:
-        return f"Error generating response: {str(e)}"
+        yield f"{GROQ_ERROR_PREFIX} {str(e)}", None
 
 
 def get_user_voting_insight(comparison_df: pd.DataFrame) -> str:
@@ -184,6 +389,276 @@ def get_user_voting_insight(comparison_df: pd.DataFrame) -> str:
         return f"Could not generate insight: {str(e)}"
 
 
+def get_user_voting_insight_stream(comparison_df: pd.DataFrame) -> Iterator[str]:
+    """Stream the voting insight, yielding the accumulated text after each chunk.
+
+    Suitable for Gradio generator handlers, which replace the output on every yield.
+    Follows _generate_analysis: only a response cut off by max_tokens gets tail calls,
+    a failed call ends the stream with the text so far (or the error message if there
+    is none), and only an analysis produced without failures is stored in ANALYSIS_CACHE.
+    A prompt already in ANALYSIS_CACHE is answered from it in a single yield.
+    """
+    if comparison_df is None or comparison_df.empty:
+        return
+
+    try:
+        prompt = _build_analysis_prompt(comparison_df)
+        cached = ANALYSIS_CACHE.peek((prompt,))
+        if cached is not None and cached[1]:
+            yield cached[0]
+            return
+
+        chunks: list[str] = []
+        text = ""
+        started = False
+        finish_reason = None
+        for delta, reason in _stream_groq_with_reason(
+            prompt, MODEL_ANALYSIS, temperature=0.5, max_tokens=1200, stop=[ANALYSIS_END_TAG]
+        ):
+            if delta.startswith(GROQ_ERROR_PREFIX):
+                yield _strip_analysis_tags("".join(chunks)) or delta
+                return
+            finish_reason = reason or finish_reason
+            chunks.append(delta)
+            if not started:
+                # Hold back output while only (part of) the <analysis> tag has arrived; once
+                # past it, each chunk is appended as is and the tags are stripped once at the end
+                head = "".join(chunks).lstrip()
+                if ANALYSIS_START_TAG.startswith(head):
+                    continue
+                started = True
+                delta = head.removeprefix(ANALYSIS_START_TAG)
+            text += delta if text else delta.lstrip()
+            if text:
+                yield text
+
+        analysis = _strip_analysis_tags("".join(chunks))
+        for tail_tokens in (240, 120):
+            if finish_reason != "length" or _is_text_complete(analysis):
+                break
+            prefix = analysis + " " if analysis else ""
+            tail = ""
+            finish_reason = None
+            for delta, reason in _stream_groq_with_reason(
+                _continuation_prompt(analysis), MODEL_ANALYSIS, temperature=0.5, max_tokens=tail_tokens
+            ):
+                if delta.startswith(GROQ_ERROR_PREFIX):
+                    # Never send the error on as "Previous text"; keep what was generated
+                    yield analysis
+                    return
+                finish_reason = reason or finish_reason
+                tail += delta if tail else delta.lstrip()
+                if tail:
+                    yield prefix + tail
+            analysis = (prefix + tail).strip()
+
+        if analysis:
+            # Loader just returns the finished text, so this only populates the cache
+            ANALYSIS_CACHE.get((prompt,), lambda: (analysis, True))
+        yield analysis
+    except Exception as e:
+        yield f"Could not generate insight: {str(e)}"
+
+
+def _find_json_array(text: str) -> str | None:
+    """Return the first bracket-balanced JSON array of objects (``[ {...} ]``) in text.
+
+    Single linear scan that tracks string literals and escapes, so brackets inside
+    quoted values don't end the match early. Returns None if no complete array is found.
+    """
+    start = text.find("[")
+    while start >= 0:
+        # Only arrays whose first element is an object are candidates
+        first = start + 1
+        while first < len(text) and text[first].isspace():
+            first += 1
+        if first < len(text) and text[first] == "{":
+            depth = 0
+            in_str = False
+            escaped = False
+            for i in range(start, len(text)):
+                c = text[i]
+                if escaped:
+                    escaped = False
+                elif c == "\\":
+                    escaped = in_str
+                elif c == '"':
+                    in_str = not in_str
+                elif in_str:
+                    continue
+                elif c == "[":
+                    depth += 1
+                elif c == "]":
+                    depth -= 1
+                    if depth == 0:
+                        return text[start : i + 1]
+            return None
+        start = text.find("[", start + 1)
+    return None
+
+
+def _parse_truncated_array(text: str) -> list | None:
+    """Parse a JSON array of objects that was cut off before its closing bracket.
+
+    pydantic_core's partial mode keeps every element that completed and drops the
+    unfinished tail (incomplete objects lose their truncated keys, so they fail the
+    required-field check later). Returns None if there is no array or it is invalid.
+    """
+    match = _ARRAY_OF_OBJECTS_START.search(text)
+    if match is None:
+        return None
+    try:
+        data = from_json(text[match.start() :], allow_partial=True)
+    except ValueError:
+        return None
+    return data if isinstance(data, list) else None
+
+
+def _lenient_loads(text: str):
+    """Second-chance parse for almost-JSON (single quotes, trailing commas); None if it fails.
+
+    Maps JSON's true/false/null outside string literals to Python's, then uses
+    ast.literal_eval, which only builds literals and never executes code. Only called
+    after strict JSON parsing has already failed, so valid replies never pay for it.
+    """
+
+    def _to_python(match: re.Match) -> str:
+        quoted, keyword = match.groups()
+        return quoted or _PY_LITERALS[keyword]
+
+    try:
+        return ast.literal_eval(_JSON_KEYWORDS.sub(_to_python, text))
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _valid_recommendations(items: list, n: int) -> list[dict[str, str]]:
+    """Keep the first n entries that are dicts with song, artist and reason, as strings."""
+    valid_recs = []
+    for rec in items[:n]:  # Limit to n recommendations
+        if isinstance(rec, dict) and all(k in rec for k in ["song", "artist", "reason"]):
+            valid_recs.append({"song": str(rec["song"]), "artist": str(rec["artist"]), "reason": str(rec["reason"])})
+    return valid_recs
+
+
+def _parse_single_recommendation(response: str) -> dict[str, str] | None:
+    """Parse one JSON-mode recommendation object; None if it is not a valid object."""
+    try:
+        rec = _json_loads(response)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(rec, dict) and all(k in rec for k in ["song", "artist", "reason"]):
+        return {"song": str(rec["song"]), "artist": str(rec["artist"]), "reason": str(rec["reason"])}
+    return None
+
+
+def _is_json_mode_rejection(response: str) -> bool:
+    """Check whether a call_groq error says the model does not accept JSON mode."""
+    return response.startswith(GROQ_ERROR_PREFIX) and ("response_format" in response or "json_object" in response)
+
+
+def _generate_recommendations_parallel(top_songs: list[str], bottom_songs: list[str], n: int) -> list[dict[str, str]]:
+    """Request n recommendations as n concurrent single-object JSON-mode calls.
+
+    Wall time is the slowest call rather than one long generation, and a bad response
+    only loses its own recommendation. Every prompt lists the picks made so far so the
+    model does not repeat them. Failed calls and repeated picks are dropped, so fewer
+    than n (possibly none, e.g. LLM disabled) may come back; the caller tops up from
+    the single batched prompt. A model that rejects JSON mode is remembered and skipped.
+    """
+    if n <= 0 or MODEL_JSON in _JSON_MODE_UNSUPPORTED:
+        return []
+
+    picked: list[str] = []
+    picked_lock = threading.Lock()
+
+    def request(index: int) -> dict[str, str] | None:
+        if MODEL_JSON in _JSON_MODE_UNSUPPORTED:
+            # An earlier call in this batch was rejected; don't queue more doomed calls
+            return None
+        with picked_lock:
+            exclude = list(picked)
+        prompt = render_single_recommendation_prompt(
+            top_songs=top_songs, bottom_songs=bottom_songs, index=index, n=n, exclude=exclude
+        )
+        try:
+            response = call_groq(
+                prompt,
+                MODEL_JSON,
+                temperature=0.2,
+                max_tokens=SINGLE_RECOMMENDATION_MAX_TOKENS,
+                response_format={"type": "json_object"},
+            )
+        except Exception:
+            return None
+        if _is_json_mode_rejection(response):
+            _JSON_MODE_UNSUPPORTED.add(MODEL_JSON)
+            return None
+        rec = _parse_single_recommendation(response)
+        if rec is not None:
+            with picked_lock:
+                picked.append(rec["song"])
+        return rec
+
+    with ThreadPoolExecutor(max_workers=min(n, RECOMMENDATION_MAX_WORKERS)) as pool:
+        results = list(pool.map(request, range(n)))
+
+    # Keep request order; drop failures and repeated picks
+    recs: list[dict[str, str]] = []
+    seen: set[str] = set()
+    for rec in results:
+        if rec is None or rec["song"].lower() in seen:
+            continue
+        seen.add(rec["song"].lower())
+        recs.append(rec)
+    return recs
+
+
+def _generate_recommendations_batched(
+    top_songs: list[str], bottom_songs: list[str], n: int, exclude: list[str] | None = None
+) -> list[dict[str, str]]:
+    """Request n recommendations in one prompt and parse the JSON array out of the reply.
+
+    exclude lists picks already made, which the prompt asks the model not to repeat.
+
+    Returns:
+        The valid recommendations in the reply (at most n, possibly none)
+
+    Raises:
+        LLMError: If the reply holds no usable JSON array; args are the (song, reason)
+            placeholder generate_recommendations shows in that case
+    """
+    # Build prompt for artist/genre recommendations (more grounded, less hallucination)
+    prompt = render_recommendations_prompt(top_songs=top_songs, bottom_songs=bottom_songs, n=n, exclude=exclude)
+
+    # Structured JSON output model, lower temperature
+    response = call_groq(prompt, MODEL_JSON, temperature=0.2, max_tokens=800)
+
+    # Try to parse JSON from response
+    # Extract JSON array if wrapped in markdown or other text
+    json_str = _find_json_array(response)
+    if json_str is not None:
+        try:
+            recommendations = _json_loads(json_str)
+        except json.JSONDecodeError as e:
+            recommendations = _lenient_loads(json_str)
+            if recommendations is None:
+                raise LLMError("Unable to parse recommendations", f"JSON parsing error: {str(e)[:100]}") from e
+
+        # Validate structure
+        if isinstance(recommendations, list):
+            return _valid_recommendations(recommendations, n)
+    else:
+        # Reply cut off mid-array (e.g. at max_tokens): keep the objects that completed
+        truncated = _parse_truncated_array(response)
+        if truncated:
+            valid_recs = _valid_recommendations(truncated, n)
+            if valid_recs:
+                return valid_recs
+
+    raise LLMError("Unable to analyze taste", "Could not parse AI response. Please try refreshing.")
+
+
 def generate_recommendations(top5: list[str], bottom5: list[str], n: int = 5) -> list[dict[str, str]]:
     """Generate artist/genre recommendations based on user's top 5 and bottom 5 songs.
 
@@ -200,82 +675,42 @@ def generate_recommendations(top5: list[str], bottom5: list[str], n: int = 5) ->
         return []
 
     # Sanitize song names to prevent JSON parsing issues with escape sequences
-    def sanitize_song(song: str) -> str:
-        """Remove problematic characters from song names."""
-        return song.replace("\\", "/").replace("\n", " ").replace("\r", " ").strip()
+    top5_clean = [s.translate(_SANITIZE_TABLE).strip() for s in top5]
+    bottom5_clean = [s.translate(_SANITIZE_TABLE).strip() for s in bottom5]
 
-    top5_clean = [sanitize_song(s) for s in top5]
-    bottom5_clean = [sanitize_song(s) for s in bottom5]
-
-    # Build prompt for artist/genre recommendations (more grounded, less hallucination)
-    prompt = render_recommendations_prompt(top_songs=top5_clean, bottom_songs=bottom5_clean, n=n)
+    # Fast path: one small JSON-mode call per recommendation, issued concurrently
+    parallel_recs = _generate_recommendations_parallel(top5_clean, bottom5_clean, n)
+    if len(parallel_recs) >= n:
+        return parallel_recs
 
+    # Some or all concurrent calls failed or repeated a pick: ask the batched prompt for the rest
     try:
-        # Structured JSON output model, lower temperature
-        response = call_groq(prompt, MODEL_JSON, temperature=0.2, max_tokens=800)
-
-        # Try to parse JSON from response
-        import json
-        import re
-
-        # Extract JSON array if wrapped in markdown or other text
-        # Try to find balanced brackets to handle complex content
-        json_match = re.search(r"\[\s*\{.*\}\s*\]", response, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(0)
-            try:
-                recommendations = json.loads(json_str)
-            except json.JSONDecodeError:
-                # Try with re.escape to handle backslashes in content
-                # Find first [ and last ] and extract everything between
-                start_idx = response.find("[")
-                end_idx = response.rfind("]")
-                if start_idx >= 0 and end_idx > start_idx:
-                    json_str = response[start_idx : end_idx + 1]
-                    try:
-                        recommendations = json.loads(json_str)
-                    except json.JSONDecodeError as e:
-                        # If still failing, return empty with helpful error
-                        return [
-                            {
-                                "song": "Unable to parse recommendations",
-                                "artist": "",
-                                "reason": f"JSON parsing error: {str(e)[:100]}",
-                            }
-                        ]
-                else:
-                    return [
-                        {
-                            "song": "Unable to analyze taste",
-                            "artist": "",
-                            "reason": "Could not find JSON in AI response.",
-                        }
-                    ]
-
-            # Validate structure
-            if isinstance(recommendations, list):
-                valid_recs = []
-                for rec in recommendations[:n]:  # Limit to n recommendations
-                    if isinstance(rec, dict) and all(k in rec for k in ["song", "artist", "reason"]):
-                        valid_recs.append(
-                            {"song": str(rec["song"]), "artist": str(rec["artist"]), "reason": str(rec["reason"])}
-                        )
-                return valid_recs
-
-        # Fallback if JSON parsing fails
-        return [
-            {
-                "song": "Unable to analyze taste",
-                "artist": "",
-                "reason": "Could not parse AI response. Please try refreshing.",
-            }
-        ]
-
+        batched_recs = _generate_recommendations_batched(
+            top5_clean, bottom5_clean, n - len(parallel_recs), exclude=[rec["song"] for rec in parallel_recs]
+        )
+    except LLMError as e:
+        if parallel_recs:
+            return parallel_recs
+        song, reason = e.args
+        return [{"song": song, "artist": "", "reason": reason}]
     except Exception as e:
+        if parallel_recs:
+            return parallel_recs
         return [
             {"song": "Error generating recommendations", "artist": "", "reason": f"An error occurred: {str(e)[:100]}"}
         ]
 
+    # Keep the concurrent picks first and top up with batched picks not already chosen
+    recs = list(parallel_recs)
+    seen = {rec["song"].lower() for rec in recs}
+    for rec in batched_recs:
+        if len(recs) >= n:
+            break
+        if rec["song"].lower() not in seen:
+            seen.add(rec["song"].lower())
+            recs.append(rec)
+    return recs
+
 
 if __name__ == "__main__":
     df = fetch_df()
@@ -1,47 +1,167 @@
+import json
+from functools import lru_cache
+from urllib.parse import quote
+
 import gspread
 import pandas as pd
+from gspread.urls import SPREADSHEET_VALUES_URL
+from gspread.utils import absolute_range_name, extract_id_from_url
 
-from config import LEGACY_SPREADSHEET_URL, SPREADSHEET_CONFIG, SUPPORTED_YEARS
+from cache import DiskDataFrameCache
+from config import CACHE_DIR, LEGACY_SPREADSHEET_URL, SONG_COLUMNS_START_INDEX, SPREADSHEET_CONFIG, SUPPORTED_YEARS
 from credentials import authenticate
+from settings import settings
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+
+    PYARROW_AVAILABLE = True
+except Exception:
+    # pyarrow is optional; metadata columns stay as regular pandas strings without it
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except Exception:
+    # orjson is optional; sheet values are decoded with the stdlib json module without it
+    ORJSON_AVAILABLE = False
+
+# Fetched sheets persisted as Parquet so restarts and other workers skip the network
+SHEET_CACHE = DiskDataFrameCache(CACHE_DIR, ttl_seconds=settings.cache_ttl_seconds)
 
 
-def _sanitize_headers(headers: list[str]) -> list[str]:
-    """Return a list of unique, non-empty headers.
+@lru_cache(maxsize=16)
+def _sanitize_headers(headers: tuple[str, ...]) -> tuple[str, ...]:
+    """Return unique, non-empty headers.
 
     - Empty/None headers are replaced with col_1, col_2, ... (1-indexed)
     - Duplicate names are suffixed with _2, _3, ... to ensure uniqueness
+
+    Takes a tuple so results can be cached; sheet header rows rarely change between fetches.
     """
     cleaned: list[str] = []
     seen: set[str] = set()
+    # Next suffix to try per base name; smaller suffixes are already taken
+    next_suffix: dict[str, int] = {}
     for i, h in enumerate(headers):
         name = (h or "").strip()
         if not name:
             name = f"col_{i + 1}"
-        base = name
-        n = 1
-        while name in seen:
-            n += 1
+        if name in seen:
+            base = name
+            n = next_suffix.get(base, 2)
+            while f"{base}_{n}" in seen:
+                n += 1
             name = f"{base}_{n}"
+            next_suffix[base] = n + 1
         seen.add(name)
         cleaned.append(name)
-    return cleaned
+    return tuple(cleaned)
+
+
+def _parse_values(payload: bytes) -> list[list[str]]:
+    """Decode a Sheets values.get response body into rectangular rows.
+
+    The API drops trailing empty cells, so short rows are padded with "" to the
+    widest row (matching what gspread's get_all_values returns).
+    """
+    data = orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+    values = data.get("values", [])
+    width = max(map(len, values), default=0)
+    return [row + [""] * (width - len(row)) for row in values]
 
 
-def _worksheet_to_dataframe(ws: gspread.Worksheet) -> pd.DataFrame:
-    """Convert a gspread worksheet to a DataFrame with sanitized headers.
+@lru_cache(maxsize=len(SUPPORTED_YEARS))
+def _sheet_location(year: int) -> tuple[str, str]:
+    """Resolve (spreadsheet_id, sheet_title) for a year once per process.
 
-    Uses get_all_values so we can supply our own headers when the first row
-    has blanks/duplicates.
+    The legacy spreadsheet ID comes straight from its URL and its tabs are named by
+    year, so no request is needed. The 2024 spreadsheet is opened by name (Drive lookup
+    plus metadata) only on the first call; later fetches go straight to the values.
+    """
+    if year == 2024:
+        spreadsheet = authenticate().open(SPREADSHEET_CONFIG[2024])
+        return spreadsheet.id, spreadsheet.sheet1.title
+    if year in (2019, 2023):
+        # Older data in one spreadsheet with one tab per year ("2019", "2023")
+        return extract_id_from_url(LEGACY_SPREADSHEET_URL), str(year)
+    raise ValueError(f"Year {year} not supported. Choose from: {', '.join(map(str, SUPPORTED_YEARS))}")
+
+
+def _get_values(gc: gspread.Client, spreadsheet_id: str, sheet_title: str) -> list[list[str]]:
+    """Fetch every cell of one sheet with a single values.get request.
+
+    The request goes over the client's pooled, authenticated session and the raw body
+    is decoded with orjson (see _parse_values), skipping gspread's per-call metadata
+    lookups, stdlib JSON parse and per-cell post-processing.
+    """
+    url = SPREADSHEET_VALUES_URL % (spreadsheet_id, quote(absolute_range_name(sheet_title)))
+    response = gc.http_client.request("get", url)
+    return _parse_values(response.content)
+
+
+def _values_to_dataframe(values: list[list[str]]) -> pd.DataFrame:
+    """Build a DataFrame from raw sheet rows with sanitized headers.
+
+    The first row is the header; we supply our own cleaned names when it has
+    blanks/duplicates.
     """
-    values = ws.get_all_values()
     if not values:
         return pd.DataFrame()
-    headers = _sanitize_headers(values[0])
+    headers = list(_sanitize_headers(tuple(values[0])))
     rows = values[1:]
     df = pd.DataFrame(rows, columns=headers)
     return df
 
 
+def _to_number(col: pd.Series) -> pd.Series:
+    """Coerce one column of sheet strings to numbers, like pd.to_numeric(errors="coerce").
+
+    The common case (numeric strings and blanks) is parsed by a single Arrow cast in C++;
+    columns with other text, or non-string cells, fall back to pd.to_numeric.
+    """
+    if not PYARROW_AVAILABLE:
+        return pd.to_numeric(col, errors="coerce")
+    try:
+        arr = pc.utf8_trim_whitespace(pa.array(col, from_pandas=True))
+        arr = pc.if_else(pc.equal(arr, ""), pa.scalar(None, pa.string()), arr)
+        # pd.to_numeric yields int64 when every cell is an integer literal; keep that dtype
+        whole = arr.null_count == 0 and pc.all(pc.match_substring_regex(arr, r"^[+-]?\d+$")).as_py()
+        values = pc.cast(arr, pa.int64() if whole else pa.float64()).to_numpy(zero_copy_only=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pd.to_numeric(col, errors="coerce")
+    return pd.Series(values, index=col.index, name=col.name)
+
+
+def _coerce_scores(df: pd.DataFrame, meta_cols: int = SONG_COLUMNS_START_INDEX) -> pd.DataFrame:
+    """Convert song score columns (everything after the metadata columns) to numbers once.
+
+    Blank or non-numeric cells become NaN, so downstream pd.to_numeric calls are no-ops.
+    """
+    if df.empty or len(df.columns) <= meta_cols:
+        return df
+    song_cols = df.columns[meta_cols:]
+    df[song_cols] = df[song_cols].apply(_to_number)
+    return df
+
+
+def _arrow_metadata(df: pd.DataFrame, meta_cols: int = SONG_COLUMNS_START_INDEX) -> pd.DataFrame:
+    """Store the metadata columns (Timestamp, Email address) as Arrow-backed strings.
+
+    Email prefix matching runs on these columns for every user lookup; Arrow strings are
+    compact and their .str methods run in C++. Score columns are left as float64.
+    No-op when pyarrow is not installed.
+    """
+    if not PYARROW_AVAILABLE or df.empty:
+        return df
+    meta = df.columns[:meta_cols]
+    df[meta] = df[meta].astype("string[pyarrow]")
+    return df
+
+
 def fetch_data(year: int = 2024):
     """Authenticate and load Google Sheet data for the specified year.
 
@@ -58,22 +178,22 @@ def fetch_data(year: int = 2024):
     account (paste the JSON starting with {"type": "service_account", ...}).
     """
     gc = authenticate()
+    spreadsheet_id, sheet_title = _sheet_location(year)
+    df = _values_to_dataframe(_get_values(gc, spreadsheet_id, sheet_title))
 
-    # Select spreadsheet and sheet based on year
     if year == 2024:
-        spreadsheet = gc.open(SPREADSHEET_CONFIG[2024])
-        worksheet = spreadsheet.sheet1
-        # For 2024 the header row is stable; get_all_records is fine
-        data = worksheet.get_all_records()
-        df = pd.DataFrame(data)
-    elif year in [2019, 2023]:
-        # Older data in one spreadsheet with multiple sheets
-        spreadsheet = gc.open_by_url(LEGACY_SPREADSHEET_URL)
-        # Get worksheet by name (assuming sheets are named "2019" and "2023")
-        worksheet = spreadsheet.worksheet(str(year))
-        # Use a custom header sanitizer to avoid duplicate/blank header errors
-        df = _worksheet_to_dataframe(worksheet)
-    else:
-        raise ValueError(f"Year {year} not supported. Choose from: {', '.join(map(str, SUPPORTED_YEARS))}")
+        df = _arrow_metadata(_coerce_scores(df))
 
     return df
+
+
+def fetch_data_cached(year: int = 2024) -> pd.DataFrame:
+    """Return fetch_data(year), served from the on-disk Parquet cache while fresh.
+
+    Entries expire after settings.cache_ttl_seconds; call SHEET_CACHE.invalidate()
+    to force the next call back to Google Sheets.
+
+    Args:
+        year: Year to load data for (2019, 2023, or 2024)
+    """
+    return SHEET_CACHE.get(f"sheet-{year}", lambda: fetch_data(year))
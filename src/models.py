@@ -3,10 +3,28 @@ Dashboard data structures using dataclasses.
 Replaces tuple returns with strongly-typed objects.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import pandas as pd
-import plotly.graph_objects as go
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Shared placeholder for missing tables; to_tuple only hands it to Gradio,
+# which serializes without mutating, so one instance is enough.
+_EMPTY_DF = pd.DataFrame()
+
+
+@lru_cache(maxsize=1)
+def _empty_figure() -> go.Figure:
+    """Shared placeholder for missing plots, built on first use so importing this module skips plotly."""
+    import plotly.graph_objects as go
+
+    return go.Figure()
 
 
 @dataclass
@@ -60,21 +78,22 @@ class DashboardData:
         Convert dataclass to tuple for backward compatibility with Gradio.
         Order matches original create_dashboard() return tuple.
         """
+        empty_fig = _empty_figure()
         return (
             self.overview,
-            self.podium_plot or go.Figure(),
-            self.top10_plot or go.Figure(),
-            self.distribution_plot or go.Figure(),
-            self.all_votes_plot or go.Figure(),
-            self.main_plot or go.Figure(),
-            self.all_songs_table if self.all_songs_table is not None else pd.DataFrame(),
-            self.user_comparison_table if self.user_comparison_table is not None else pd.DataFrame(),
-            self.disagreements_plot or go.Figure(),
-            self.user_vs_top10_plot or go.Figure(),
-            self.heatmap_plot or go.Figure(),
-            self.controversy_plot or go.Figure(),
-            self.agreeable_plot or go.Figure(),
-            self.rating_pattern_plot or go.Figure(),
-            self.taste_map_plot or go.Figure(),
+            self.podium_plot or empty_fig,
+            self.top10_plot or empty_fig,
+            self.distribution_plot or empty_fig,
+            self.all_votes_plot or empty_fig,
+            self.main_plot or empty_fig,
+            self.all_songs_table if self.all_songs_table is not None else _EMPTY_DF,
+            self.user_comparison_table if self.user_comparison_table is not None else _EMPTY_DF,
+            self.disagreements_plot or empty_fig,
+            self.user_vs_top10_plot or empty_fig,
+            self.heatmap_plot or empty_fig,
+            self.controversy_plot or empty_fig,
+            self.agreeable_plot or empty_fig,
+            self.rating_pattern_plot or empty_fig,
+            self.taste_map_plot or empty_fig,
             self.recommendations_display,
         )
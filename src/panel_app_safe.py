@@ -1,36 +1,65 @@
 # panel_app.py
+import warnings
 from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 import panel as pn
 import plotly.express as px
+import plotly.graph_objects as go
 
-from load_data import fetch_data
+from cache import CachedDataLoader
+from config import DEFAULT_YEAR, SPREADSHEET_CONFIG
+from load_data import SHEET_CACHE, fetch_data_cached
+from settings import settings
 
 pn.extension("plotly")
 
+SHEET_KEY = SPREADSHEET_CONFIG[DEFAULT_YEAR]
+
+# Computed (raw, avg, metrics) tuple per spreadsheet; expires with the same TTL
+SCORES_CACHE = CachedDataLoader(
+    ttl_seconds=settings.cache_ttl_seconds,
+    max_size=settings.cache_max_size,
+)
+
 
 # ---------- data prep ----------
 def compute_scores(df: pd.DataFrame):
-    """Return (raw_df, avg_scores) where avg_scores has columns [Song, Average Score]."""
+    """Return (raw_df, avg_scores) where avg_scores has columns [Song, Average Score].
+
+    raw_df is the input frame, unmodified; the scores are coerced into a separate
+    float matrix rather than written back into a copy of the responses.
+    """
     if df is None or df.empty or len(df.columns) < 3:
         return df, pd.DataFrame(columns=["Song", "Average Score"])
 
     song_cols = df.columns[2:]
-    df = df.copy()
-    df[song_cols] = df[song_cols].apply(pd.to_numeric, errors="coerce")
+    block = df[song_cols]
+    if all(pd.api.types.is_numeric_dtype(t) for t in block.dtypes):
+        # fetch_data already coerces 2024 scores; take the float matrix directly
+        scores = block.to_numpy(dtype=np.float64)
+    else:
+        # one to_numeric over the flattened score block instead of a per-column apply
+        flat = pd.Series(block.to_numpy().ravel())
+        scores = pd.to_numeric(flat, errors="coerce").to_numpy(dtype=np.float64).reshape(len(df), len(song_cols))
 
-    avg_scores = df[song_cols].mean().dropna().reset_index().rename(columns={"index": "Song", 0: "Average Score"})
+    with warnings.catch_warnings():
+        # songs nobody rated give an all-NaN column ("Mean of empty slice"); dropped below
+        warnings.simplefilter("ignore", RuntimeWarning)
+        means = np.nanmean(scores, axis=0)
+    avg_scores = pd.DataFrame({"Song": song_cols, "Average Score": means}).dropna()
     # remove zeros and sort ascending so bars grow upward
     avg_scores = avg_scores[avg_scores["Average Score"] > 0].copy()
     avg_scores = avg_scores.sort_values("Average Score", ascending=True).reset_index(drop=True)
     return df, avg_scores
 
 
-@lru_cache(maxsize=1)
-def get_data_cached():
-    df = fetch_data()
+def _load_scores():
+    df = fetch_data_cached(DEFAULT_YEAR)
     raw, avg = compute_scores(df)
+    # lowercase once here so the search box doesn't re-lower every title per keystroke
+    avg["_song_lower"] = avg["Song"].astype(str).str.lower()
     total_votes = len(raw) if raw is not None else 0
     if not avg.empty:
         highest = f"{avg.iloc[-1]['Song']} ({avg.iloc[-1]['Average Score']:.2f})"
@@ -41,15 +70,28 @@ def get_data_cached():
     return raw, avg, total_votes, highest, avg_of_avgs
 
 
+def get_data_cached():
+    return SCORES_CACHE.get((SHEET_KEY,), _load_scores)
+
+
 def refresh_data(event=None):
-    get_data_cached.cache_clear()
+    SCORES_CACHE.invalidate((SHEET_KEY,))
+    SHEET_CACHE.invalidate(f"sheet-{DEFAULT_YEAR}")
+    render_metrics()
     render()  # re-draw with fresh data
 
 
 # ---------- plotting ----------
 def make_bar(df_plot: pd.DataFrame):
+    # Figures are memoized on the plotted values, so slider ticks or keystrokes
+    # that don't change the filtered rows reuse the previous figure.
+    return _bar_figure(tuple(df_plot["Song"]), tuple(df_plot["Average Score"]))
+
+
+@lru_cache(maxsize=32)
+def _bar_figure(songs: tuple, scores: tuple):
     fig = px.bar(
-        df_plot,
+        pd.DataFrame({"Song": list(songs), "Average Score": list(scores)}),
         x="Average Score",
         y="Song",
         orientation="h",
@@ -73,13 +115,20 @@ def make_bar(df_plot: pd.DataFrame):
 
 
 def make_hist(avg_scores: pd.DataFrame):
-    fig = px.histogram(
-        avg_scores,
-        x="Average Score",
-        nbins=10,
-        title="Distribution of Ratings",
+    # Bin server-side so the payload is 10 bars no matter how many songs there are
+    counts, edges = np.histogram(avg_scores["Average Score"].to_numpy(dtype=np.float64), bins=10)
+    fig = go.Figure(
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            hovertemplate="Average Score: %{x:.2f}<br>count: %{y}<extra></extra>",
+        )
     )
     fig.update_layout(
+        title="Distribution of Ratings",
+        xaxis_title="Average Score",
+        yaxis_title="count",
         plot_bgcolor="white",
         paper_bgcolor="white",
         title_x=0.5,
@@ -98,14 +147,76 @@ refresh = pn.widgets.Button(name="🔄 Refresh from Google Sheet", button_type="
 
 # ---------- panes / outputs ----------
 metrics_md = pn.pane.Markdown("### 📊 Key Metrics\n_Loading…_")
-table_w = pn.widgets.DataFrame(disabled=True, sizing_mode="stretch_width", height=360)
+# Remote pagination ships one page of rows to the browser instead of the whole frame
+table_w = pn.widgets.Tabulator(
+    pd.DataFrame(columns=["Song", "Average Score"]),
+    disabled=True,
+    pagination="remote",
+    page_size=25,
+    frozen_columns=["Song"],
+    show_index=False,
+    sizing_mode="stretch_width",
+)
 bar_pane = pn.pane.Plotly(sizing_mode="stretch_width")
 hist_pane = pn.pane.Plotly(sizing_mode="stretch_width")
 
+# Row hashes of the table as last sent to the browser (see _set_table)
+_last_table_hash = np.empty(0, dtype=np.uint64)
+
+
+def _set_table(view: pd.DataFrame):
+    """Push view to the table widget unless it matches what is already displayed.
+
+    Assigning table_w.value re-serializes the whole frame to the front end, so
+    filter events that leave the visible rows unchanged skip the write.
+    """
+    global _last_table_hash
+    row_hash = pd.util.hash_pandas_object(view, index=False).to_numpy()
+    if table_w.value is not None and np.array_equal(row_hash, _last_table_hash):
+        return
+    _last_table_hash = row_hash
+    table_w.value = view
+
+
+# Averages frame the histogram was last drawn from (see _set_hist)
+_hist_source = None
+
+
+def _set_hist(avg: pd.DataFrame):
+    """Redraw the histogram only when the averages change.
+
+    It ignores the filters, and get_data_cached returns the same frame object until
+    the cache expires or is refreshed, so identity is enough to detect new data.
+    """
+    global _hist_source
+    if avg is not _hist_source:
+        hist_pane.object = make_hist(avg)
+        _hist_source = avg
+
+
+def _set_bar(fig):
+    """Assign the bar figure; make_bar is memoized, so an unchanged filter returns the same object."""
+    if bar_pane.object is not fig:
+        bar_pane.object = fig
+
+
+def render_metrics():
+    """Update the key-metrics pane; it depends only on the data, not on the filters."""
+    _, avg, total_votes, highest_txt, avg_all = get_data_cached()
+    if avg.empty:
+        metrics_md.object = "### 📊 Key Metrics\n_No data yet._"
+        return
+
+    metrics_md.object = f"""### 📊 Key Metrics
+- **Total Votes**: {total_votes}
+- **Highest Rated**: {highest_txt}
+- **Average of Averages**: {avg_all:.2f}
+"""
+
 
 def render(event=None):
-    """Read cached data, set widget bounds, recompute filters, and update panes."""
-    raw, avg, total_votes, highest_txt, avg_all = get_data_cached()
+    """Read cached data, set widget bounds, recompute filters, and update the plot/table panes."""
+    _, avg, _, _, _ = get_data_cached()
 
     # set sensible widget bounds based on data
     if not avg.empty:
@@ -130,37 +241,34 @@ def render(event=None):
             q = q[q["Average Score"] >= float(min_rating.value)]
         if search.value:
             s = search.value.lower()
-            q = q[q["Song"].str.lower().str.contains(s, na=False)]
+            q = q[q["_song_lower"].str.contains(s, regex=False, na=False)]
         if topn.value is not None and topn.value > 0:
-            q = q.sort_values("Average Score", ascending=False).head(int(topn.value))
-            q = q.sort_values("Average Score", ascending=True)
+            # partial top-k selection, then one stable sort of the k survivors
+            q = q.nlargest(int(topn.value), "Average Score").sort_values(
+                "Average Score", ascending=True, kind="mergesort"
+            )
         q = q.reset_index(drop=True)
 
-    # update metrics
     if avg.empty:
-        metrics_md.object = "### 📊 Key Metrics\n_No data yet._"
-        table_w.value = avg.head(0)
-        bar_pane.object = make_bar(avg.head(0))
-        hist_pane.object = make_hist(avg.head(0))
+        _set_table(avg[["Song", "Average Score"]].head(0))
+        _set_bar(make_bar(avg.head(0)))
+        _set_hist(avg)
         return
 
-    metrics_md.object = f"""### 📊 Key Metrics
-- **Total Votes**: {total_votes}
-- **Highest Rated**: {highest_txt}
-- **Average of Averages**: {avg_all:.2f}
-"""
-
-    table_w.value = q[["Song", "Average Score"]]
-    bar_pane.object = make_bar(q if not q.empty else avg.head(0))
-    hist_pane.object = make_hist(avg)
+    _set_table(q[["Song", "Average Score"]])
+    _set_bar(make_bar(q if not q.empty else avg.head(0)))
+    _set_hist(avg)
 
 
-# react to user input
-for w in (min_rating, topn, search):
-    w.param.watch(render, "value", onlychanged=True)
+# react to user input; sliders fire on release (value_throttled) rather than on every
+# drag tick, and TextInput.value only changes on enter/blur, not per keystroke
+for w in (min_rating, topn):
+    w.param.watch(render, "value_throttled", onlychanged=True)
+search.param.watch(render, "value", onlychanged=True)
 refresh.on_click(refresh_data)
 
 # initial render
+render_metrics()
 render()
 
 # ---------- layout ----------
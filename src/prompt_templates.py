@@ -3,15 +3,23 @@ LLM prompt templates using Jinja2.
 Centralizes prompt engineering and makes it maintainable.
 """
 
-from jinja2 import Template
+from jinja2 import Environment, StrictUndefined
 
 from config import LLM_ANALYSIS_MAX_WORDS, LLM_ANALYSIS_MIN_WORDS
 
+# One shared environment: templates compile once at import, and a missing
+# render variable raises instead of silently rendering as an empty string.
+_JINJA_ENV = Environment(
+    autoescape=False,
+    auto_reload=False,
+    undefined=StrictUndefined,
+)
+
 # ============================================================================
 # USER VOTING ANALYSIS PROMPT
 # ============================================================================
 
-VOTING_ANALYSIS_PROMPT = Template("""Write a friendly, conversational analysis that directly addresses the voter (use 'you' and 'your'). Keep it grounded and observational about preferences and results. Aim for {{ min_words }}–{{ max_words }} words.
+VOTING_ANALYSIS_PROMPT = _JINJA_ENV.from_string("""Write a friendly, conversational analysis that directly addresses the voter (use 'you' and 'your'). Keep it grounded and observational about preferences and results. Aim for {{ min_words }}–{{ max_words }} words.
 
 Tone constraints (important):
 - No hype or hero language. Avoid praise like "brave", "bold", "fearless", "iconic", or marathon-style metaphors.
@@ -22,6 +30,7 @@ Tone constraints (important):
 Formatting constraints:
 - Do not use emojis or emoticons.
 - Do not include headings or markdown titles; write plain paragraphs only.
+- Start your reply with <analysis> and end with a single short concluding sentence ending in a period, followed by </analysis>.
 
 Key points to hit with some gentle snark:
 - {{ biggest_over_text }}
@@ -42,7 +51,7 @@ Significant disagreements to mention:
 # ARTIST/GENRE RECOMMENDATIONS PROMPT
 # ============================================================================
 
-RECOMMENDATIONS_PROMPT = Template("""Based on the user's music taste (top songs and bottom songs), generate {{ n }} artist or genre recommendations for 2025.
+RECOMMENDATIONS_PROMPT = _JINJA_ENV.from_string("""Based on the user's music taste (top songs and bottom songs), generate {{ n }} artist or genre recommendations for 2025.
 
 Top songs they loved:
 {% for song in top_songs %}
@@ -54,7 +63,12 @@ Songs they didn't rate as highly:
 - {{ song }}
 {% endfor %}
 
-Generate recommendations as valid JSON array (no markdown wrapping):
+{% if exclude %}Already recommended, so do not suggest any of these again:
+{% for name in exclude %}
+- {{ name }}
+{% endfor %}
+
+{% endif %}Generate recommendations as valid JSON array (no markdown wrapping):
 [
   {
         "song": "Artist/Genre Name",
@@ -74,11 +88,49 @@ Return only valid JSON, no additional text or markdown code blocks.
 """)
 
 
+# ============================================================================
+# SINGLE RECOMMENDATION PROMPT (one JSON object per call)
+# ============================================================================
+
+# Each parallel call gets its own angle so the n answers don't collapse onto one artist
+RECOMMENDATION_FOCUSES = [
+    "an artist with a similar vibe to their top songs",
+    "a genre they clearly prefer based on their ratings",
+    "a hidden gem they might not have discovered yet",
+    "an artist bridging the styles of two of their top songs",
+    "a genre adjacent to their favorites that steers clear of what they rated low",
+]
+
+SINGLE_RECOMMENDATION_PROMPT = _JINJA_ENV.from_string("""Based on the user's music taste (top songs and bottom songs), suggest exactly one artist or genre for 2025.
+This is recommendation {{ index + 1 }} of {{ n }}; it should be {{ focus }}.
+
+Top songs they loved:
+{% for song in top_songs %}
+- {{ song }}
+{% endfor %}
+
+Songs they didn't rate as highly:
+{% for song in bottom_songs %}
+- {{ song }}
+{% endfor %}
+
+{% if exclude %}Already recommended, so do not suggest any of these again:
+{% for name in exclude %}
+- {{ name }}
+{% endfor %}
+
+{% endif %}Respond with a single JSON object and nothing else:
+{"song": "Artist/Genre Name", "artist": "", "reason": "2-3 sentence explanation connecting to their taste"}
+
+Do NOT recommend mainstream artists they likely already know. Be specific and thoughtful, not generic.
+""")
+
+
 # ============================================================================
 # SONG BLURB PROMPT
 # ============================================================================
 
-SONG_BLURB_PROMPT = Template("""Write a short, witty blurb (2-3 sentences) about this year's music chart.
+SONG_BLURB_PROMPT = _JINJA_ENV.from_string("""Write a short, witty blurb (2-3 sentences) about this year's music chart.
 
 The favourite song was '{{ song_name }}' with an average rating of {{ avg_score|round(2) }}.
 
@@ -153,6 +205,7 @@ def render_recommendations_prompt(
     top_songs: list,
     bottom_songs: list,
     n: int = 5,
+    exclude: list | None = None,
 ) -> str:
     """
     Render the recommendations prompt.
@@ -160,6 +213,8 @@ def render_recommendations_prompt(
     Args:
         top_songs: List of user's top songs
         bottom_songs: List of user's bottom songs
+        n: Number of recommendations to ask for
+        exclude: Artists/genres already recommended, which the model must not repeat
 
     Returns:
         Rendered prompt string
@@ -168,6 +223,37 @@ def render_recommendations_prompt(
         top_songs=top_songs,
         bottom_songs=bottom_songs,
         n=n,
+        exclude=exclude or [],
+    )
+
+
+def render_single_recommendation_prompt(
+    top_songs: list,
+    bottom_songs: list,
+    index: int,
+    n: int = 5,
+    exclude: list | None = None,
+) -> str:
+    """
+    Render the prompt for one of n parallel recommendation calls.
+
+    Args:
+        top_songs: List of user's top songs
+        bottom_songs: List of user's bottom songs
+        index: Position of this recommendation (0-based), selects its focus
+        n: Total number of recommendations requested
+        exclude: Artists/genres already recommended, which the model must not repeat
+
+    Returns:
+        Rendered prompt string
+    """
+    return SINGLE_RECOMMENDATION_PROMPT.render(
+        top_songs=top_songs,
+        bottom_songs=bottom_songs,
+        index=index,
+        n=n,
+        exclude=exclude or [],
+        focus=RECOMMENDATION_FOCUSES[index % len(RECOMMENDATION_FOCUSES)],
     )
 
 
@@ -0,0 +1,95 @@
+"""
+Tests for cache module.
+Tests the in-memory TTL cache and the disk-backed DataFrame cache.
+"""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from cache import CachedDataLoader, DiskDataFrameCache
+
+
+class TestCachedDataLoader:
+    """Test suite for CachedDataLoader."""
+
+    def test_peek_does_not_load(self):
+        """Test that peek returns the default on a miss and the value once it is cached."""
+        cache = CachedDataLoader(ttl_seconds=60)
+
+        assert cache.peek(("key",)) is None
+        assert not cache.cache
+
+        cache.get(("key",), lambda: "value")
+
+        assert cache.peek(("key",)) == "value"
+
+    def test_peek_drops_expired_entry(self):
+        """Test that peek treats an entry older than the TTL as missing."""
+        cache = CachedDataLoader(ttl_seconds=0)
+        cache.get(("key",), lambda: "value")
+
+        assert cache.peek(("key",), "miss") == "miss"
+        assert ("key",) not in cache.cache
+
+
+class TestDiskDataFrameCache:
+    """Test suite for DiskDataFrameCache."""
+
+    @staticmethod
+    def _frame() -> pd.DataFrame:
+        return pd.DataFrame({"Email address": ["a@test.com"], "Song A": [8.0]})
+
+    def test_hit_skips_loader(self, tmp_path):
+        """Test that a second get reads from disk instead of calling the loader."""
+        cache = DiskDataFrameCache(tmp_path, ttl_seconds=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return self._frame()
+
+        first = cache.get("sheet", loader)
+        second = cache.get("sheet", loader)
+
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_expired_entry_reloads(self, tmp_path):
+        """Test that entries older than the TTL are fetched again."""
+        cache = DiskDataFrameCache(tmp_path, ttl_seconds=60)
+        cache.get("sheet", self._frame)
+
+        path = cache._path("sheet")
+        old = time.time() - 120
+        os.utime(path, (old, old))
+
+        calls = []
+        cache.get("sheet", lambda: calls.append(1) or self._frame())
+        assert len(calls) == 1
+
+    def test_failed_write_still_returns_data(self, tmp_path):
+        """Test that an unwritable cache directory warns and returns the loaded frame."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = DiskDataFrameCache(blocker / "cache", ttl_seconds=60)
+
+        with pytest.warns(RuntimeWarning, match="Failed to write disk cache"):
+            data = cache.get("sheet", self._frame)
+
+        pd.testing.assert_frame_equal(data, self._frame())
+
+    def test_invalidate_removes_entry(self, tmp_path):
+        """Test that invalidate drops the stored file."""
+        cache = DiskDataFrameCache(tmp_path, ttl_seconds=60)
+        cache.get("sheet", self._frame)
+
+        cache.invalidate("sheet")
+
+        assert not cache._path("sheet").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -5,10 +5,20 @@ Tests create_dashboard output structure and error handling.
 
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from dashboard import stream_voting_insight
 from models import DashboardData
+from visuals import (
+    FIGURE_CACHE,
+    _frame_digest,
+    _score_matrix,
+    make_controversy_chart,
+    make_main_chart,
+    make_top_10_spotlight,
+)
 
 
 class TestDashboardData:
@@ -118,6 +128,31 @@ class TestCreateDashboard:
         pass
 
 
+class TestStreamVotingInsight:
+    """Test suite for stream_voting_insight."""
+
+    @patch("dashboard.get_user_voting_insight_stream")
+    @patch("dashboard.get_data_cached")
+    def test_appends_streamed_insight(self, mock_get_data, mock_stream):
+        """Test that each streamed chunk is appended to the given overview."""
+        comparison = pd.DataFrame({"Song": ["Song A"], "Your Score": [9.0]})
+        mock_get_data.return_value = (pd.DataFrame(), pd.DataFrame(), 1, 9.0, 1, None, comparison)
+        mock_stream.return_value = iter(["You like", "You like guitars."])
+
+        outputs = list(stream_voting_insight("### Winner", "user", 2024))
+
+        assert len(outputs) == 2
+        assert all(o.startswith("### Winner\n\n**Your Voting Pattern") for o in outputs)
+        assert "You like guitars." in outputs[-1]
+        mock_stream.assert_called_once_with(comparison)
+
+    @patch("dashboard.get_user_voting_insight_stream")
+    def test_no_email_yields_nothing(self, mock_stream):
+        """Test that anonymous visitors get no insight and no LLM call."""
+        assert list(stream_voting_insight("### Winner", "", 2024)) == []
+        mock_stream.assert_not_called()
+
+
 class TestTiedRanking:
     """Test suite for tied ranking logic."""
 
@@ -136,5 +171,88 @@ class TestTiedRanking:
         assert len(top1) == 2
 
 
+class TestDuplicateSongTitles:
+    """Test suite for charts whose inputs repeat a song title."""
+
+    def test_main_chart_overlay(self):
+        """Test that a repeated title in the user's votes takes its first score."""
+        avg_scores = pd.DataFrame({"Song": ["Song A", "Song B"], "Average Score": [9.0, 8.0], "Rank": [1, 2]})
+        user_votes = pd.DataFrame({"Song": ["Song B", "Song A", "Song B"], "Your Score": [5.0, 7.0, 6.0]})
+
+        fig = make_main_chart(avg_scores, user_votes)
+
+        assert list(fig.data[1].y) == ["Song B", "Song A"]
+        assert list(fig.data[1].x) == [5.0, 7.0]
+
+    def test_controversy_chart(self):
+        """Test that a repeated title in avg_scores does not break the average lookup."""
+        df_raw = pd.DataFrame(
+            {"Timestamp": ["t1", "t2"], "Email address": ["a@x", "b@x"], "Song A": [9, 3], "Song B": [8, 8]}
+        )
+        avg_scores = pd.DataFrame({"Song": ["Song A", "Song B", "Song A"], "Average Score": [6.0, 8.0, 1.0]})
+
+        fig = make_controversy_chart(df_raw, avg_scores)
+
+        assert "Song A" in list(fig.data[0].y)
+
+
+class TestFigureCache:
+    """Test suite for memoized chart builders."""
+
+    def test_equal_frames_reuse_figure(self):
+        """Test that an equal but separately built frame is served from the figure cache."""
+        avg_scores = pd.DataFrame({"Song": ["Song A", "Song B"], "Average Score": [9.0, 8.0], "Rank": [1, 2]})
+
+        first = make_top_10_spotlight(avg_scores)
+        hits = FIGURE_CACHE.hits
+        second = make_top_10_spotlight(avg_scores.copy())
+
+        assert FIGURE_CACHE.hits == hits + 1
+        assert second.to_json() == first.to_json()
+        make_top_10_spotlight(avg_scores.assign(**{"Average Score": [9.5, 8.0]}))
+        assert FIGURE_CACHE.hits == hits + 1
+
+    def test_returned_figure_mutation_does_not_leak(self):
+        """Test that editing a returned figure leaves the next cache hit unchanged."""
+        avg_scores = pd.DataFrame({"Song": ["Song A", "Song B"], "Average Score": [7.0, 6.0], "Rank": [1, 2]})
+
+        first = make_top_10_spotlight(avg_scores)
+        title = first.layout.title.text
+        first.update_layout(title={"text": "Edited"})
+        first.data[0].update(name="edited")
+
+        second = make_top_10_spotlight(avg_scores)
+
+        assert second is not first
+        assert second.layout.title.text == title
+        assert second.data[0].name != "edited"
+        # arrays stay arrays rather than to_dict()'s base64 payloads
+        assert isinstance(second.data[0].x, np.ndarray)
+
+    def test_equal_frames_share_vote_matrix(self):
+        """Test that copies of the same responses sheet are parsed once."""
+        df_raw = pd.DataFrame({"Timestamp": ["t1", "t2"], "Email address": ["a@x", "b@x"], "Song A": [8, 6]})
+
+        scores = _score_matrix(df_raw)
+
+        assert _score_matrix(df_raw.copy()) is scores
+        assert scores.tolist() == [[8.0], [6.0]]
+
+    def test_alternating_frames_hashed_once(self):
+        """Test that builders alternating between frames reuse each frame's content digest."""
+        df_raw = pd.DataFrame({"Email address": ["a@x"], "Song A": [8]})
+        avg_scores = pd.DataFrame({"Song": ["Song A"], "Average Score": [8.0]})
+
+        with patch("pandas.util.hash_pandas_object", wraps=pd.util.hash_pandas_object) as hashed:
+            for _ in range(3):
+                _frame_digest(df_raw)
+                _frame_digest(avg_scores)
+                _frame_digest(pd.DataFrame())
+
+        hashed_ids = [id(call.args[0]) for call in hashed.call_args_list]
+        assert hashed_ids.count(id(df_raw)) == 1
+        assert hashed_ids.count(id(avg_scores)) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
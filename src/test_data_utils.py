@@ -142,6 +142,22 @@ class TestGetUserVotes:
         assert user_votes.empty
         assert error is not None
 
+    def test_get_user_votes_matches_whole_prefix(self):
+        """Test that only the part before '@' is matched, and only in full."""
+        df = pd.DataFrame(
+            {
+                "Timestamp": ["2024-01-01", "2024-01-02", "2024-01-03"],
+                "Email address": ["john.smith@gmail.com", "John@Example.com", None],
+                "Song A": [8, 6, 5],
+            }
+        )
+
+        user_votes, error = get_user_votes(df, "JOHN")
+
+        assert error is None
+        assert user_votes["Your Score"].tolist() == [6]
+        assert get_user_votes(df, "john@example.com")[0].empty
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
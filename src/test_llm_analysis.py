@@ -0,0 +1,324 @@
+"""Unit tests for llm_implementation helpers and the voting analysis with mocked Groq calls."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import llm_implementation
+from llm_implementation import (
+    ANALYSIS_END_TAG,
+    GROQ_ERROR_PREFIX,
+    _generate_analysis,
+    _strip_analysis_tags,
+    _top_k_indices,
+    analyze_user_votes,
+    get_top_song,
+    get_user_voting_insight_stream,
+)
+
+_COMPARISON = pd.DataFrame(
+    {
+        "Song": ["Black Lipstick", "Starburster", "Nothing Matters"],
+        "Your Score": [9.0, 7.0, 8.5],
+        "Average Score": [6.5, 8.0, 7.5],
+        "Difference": [2.5, -1.0, 1.0],
+    }
+)
+
+_RATE_LIMITED = (f"{GROQ_ERROR_PREFIX} 429 Too Many Requests", None)
+
+
+@pytest.fixture
+def mock_groq_replies(monkeypatch):
+    """Rebind llm_implementation._call_groq_with_reason to replay canned replies.
+
+    The returned setter takes the (text, finish_reason) pairs to hand out in order and
+    returns the list of (args, kwargs) the fake was called with. ANALYSIS_CACHE is
+    cleared around each test.
+    """
+    calls = []
+
+    def _set(*replies):
+        queue = list(replies)
+
+        def fake_call(*args, **kwargs):
+            calls.append((args, kwargs))
+            return queue.pop(0)
+
+        monkeypatch.setattr(llm_implementation, "_call_groq_with_reason", fake_call)
+        return calls
+
+    llm_implementation.ANALYSIS_CACHE.clear()
+    yield _set
+    llm_implementation.ANALYSIS_CACHE.clear()
+
+
+@pytest.fixture
+def mock_groq_streams(monkeypatch):
+    """Rebind llm_implementation._stream_groq_with_reason to replay canned streams.
+
+    The returned setter takes one list of (delta, finish_reason) pairs per call and
+    returns the list of (args, kwargs) the fake was called with.
+    """
+    calls = []
+
+    def _set(*streams):
+        queue = list(streams)
+
+        def fake_stream(*args, **kwargs):
+            calls.append((args, kwargs))
+            yield from queue.pop(0)
+
+        monkeypatch.setattr(llm_implementation, "_stream_groq_with_reason", fake_stream)
+        return calls
+
+    llm_implementation.ANALYSIS_CACHE.clear()
+    yield _set
+    llm_implementation.ANALYSIS_CACHE.clear()
+
+
+class TestAnalysisCache:
+    """Test suite for caching in analyze_user_votes."""
+
+    def test_complete_analysis_is_cached(self, mock_groq_replies):
+        """Test that a finished analysis is served from the cache on replay."""
+        calls = mock_groq_replies(("<analysis>You love loud guitars.</analysis>", "stop"))
+
+        first = analyze_user_votes(_COMPARISON)
+        second = analyze_user_votes(_COMPARISON)
+
+        assert first == second == "You love loud guitars."
+        assert len(calls) == 1
+
+    def test_failed_tail_call_is_not_cached(self, mock_groq_replies):
+        """Test that a cut-off analysis whose tail call failed is regenerated next time."""
+        calls = mock_groq_replies(
+            ("You rate guitar songs", "length"),
+            _RATE_LIMITED,
+            ("You rate guitar songs", "length"),
+            ("above the group.", "stop"),
+        )
+
+        first = analyze_user_votes(_COMPARISON)
+        second = analyze_user_votes(_COMPARISON)
+
+        assert GROQ_ERROR_PREFIX not in first
+        assert second == "You rate guitar songs above the group."
+        assert len(calls) == 4
+
+
+class TestInsightStream:
+    """Test suite for get_user_voting_insight_stream."""
+
+    def test_yields_growing_text_and_caches(self, mock_groq_streams, mock_groq_replies):
+        """Test that chunks accumulate without the tags and the result is cached."""
+        mock_groq_streams([("<analysis>", None), ("You like ", None), ("guitars.", None), ("", "stop")])
+        replies = mock_groq_replies()
+
+        outputs = list(get_user_voting_insight_stream(_COMPARISON))
+
+        assert outputs[0] == "You like "
+        assert outputs[-1] == "You like guitars."
+        assert analyze_user_votes(_COMPARISON) == "You like guitars."
+        assert not replies
+
+    def test_cached_analysis_is_replayed_without_request(self, mock_groq_streams):
+        """Test that a second stream for the same comparison is served from ANALYSIS_CACHE."""
+        calls = mock_groq_streams([("You like guitars.", None), ("", "stop")])
+
+        first = list(get_user_voting_insight_stream(_COMPARISON))
+        second = list(get_user_voting_insight_stream(_COMPARISON.copy()))
+
+        assert second == [first[-1]] == ["You like guitars."]
+        assert len(calls) == 1
+
+    def test_blocking_analysis_is_replayed_by_stream(self, mock_groq_streams, mock_groq_replies):
+        """Test that the stream reuses an analysis cached by analyze_user_votes."""
+        mock_groq_replies(("<analysis>You love loud guitars.</analysis>", "stop"))
+        streams = mock_groq_streams()
+
+        analyze_user_votes(_COMPARISON)
+
+        assert list(get_user_voting_insight_stream(_COMPARISON)) == ["You love loud guitars."]
+        assert not streams
+
+    def test_many_fragments_parse_tags_at_most_twice(self, mock_groq_streams, monkeypatch):
+        """Test that a long stream is not re-stripped per chunk, only once it has ended."""
+        words = [f"word{i} " for i in range(100)]
+        mock_groq_streams([("<anal", None), ("ysis>\n", None), *((w, None) for w in words), ("", "stop")])
+        parses = []
+        strip = llm_implementation._strip_analysis_tags
+        monkeypatch.setattr(llm_implementation, "_strip_analysis_tags", lambda text: parses.append(1) or strip(text))
+
+        outputs = list(get_user_voting_insight_stream(_COMPARISON))
+
+        assert len(parses) <= 2
+        assert outputs[0] == "word0 "
+        assert outputs[-1] == "".join(words).strip()
+
+    def test_cut_off_stream_is_finished(self, mock_groq_streams):
+        """Test that a stream stopped by max_tokens gets one tail call."""
+        calls = mock_groq_streams(
+            [("You rate guitar songs", None), ("", "length")],
+            [("above the group.", None), ("", "stop")],
+        )
+
+        outputs = list(get_user_voting_insight_stream(_COMPARISON))
+
+        assert outputs[-1] == "You rate guitar songs above the group."
+        assert len(calls) == 2
+        assert calls[1][1]["max_tokens"] == 240
+
+    def test_unfinished_sentence_after_stop_is_left_alone(self, mock_groq_streams):
+        """Test that no tail call is made unless the model hit max_tokens."""
+        calls = mock_groq_streams([("You rate guitar songs", None), ("", "stop")])
+
+        outputs = list(get_user_voting_insight_stream(_COMPARISON))
+
+        assert outputs[-1] == "You rate guitar songs"
+        assert len(calls) == 1
+
+    def test_failed_stream_skips_tail_call(self, mock_groq_streams):
+        """Test that an API error is shown once and never sent on as text to continue."""
+        calls = mock_groq_streams([_RATE_LIMITED])
+
+        outputs = list(get_user_voting_insight_stream(_COMPARISON))
+
+        assert outputs == [_RATE_LIMITED[0]]
+        assert len(calls) == 1
+        assert not llm_implementation.ANALYSIS_CACHE.cache
+
+    def test_failed_tail_stream_keeps_text_uncached(self, mock_groq_streams):
+        """Test that a failed tail call ends with the partial text and caches nothing."""
+        mock_groq_streams([("You rate guitar songs", None), ("", "length")], [_RATE_LIMITED])
+
+        outputs = list(get_user_voting_insight_stream(_COMPARISON))
+
+        assert outputs[-1] == "You rate guitar songs"
+        assert not llm_implementation.ANALYSIS_CACHE.cache
+
+    def test_stream_reports_finish_reason(self, monkeypatch):
+        """Test that the streaming call pairs each delta with the chunk's finish_reason."""
+
+        def chunk(content, finish_reason=None):
+            return SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)]
+            )
+
+        completions = SimpleNamespace(create=lambda **kwargs: iter([chunk("Hi"), chunk(None, "length")]))
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        monkeypatch.setattr(llm_implementation, "LLM_ENABLED", True)
+        monkeypatch.setattr(llm_implementation, "_get_groq_client", lambda: client)
+
+        pairs = list(llm_implementation._stream_groq_with_reason("prompt"))
+
+        assert pairs == [("Hi", None), ("", "length")]
+
+
+class TestGenerateAnalysis:
+    """Test suite for _generate_analysis."""
+
+    def test_complete_first_call(self, mock_groq_replies):
+        """Test that a naturally stopped reply is used as is, with tags stripped."""
+        calls = mock_groq_replies(("<analysis>You love loud guitars.", "stop"))
+
+        assert _generate_analysis("prompt") == ("You love loud guitars.", True)
+        assert len(calls) == 1
+        assert calls[0][1]["stop"] == [ANALYSIS_END_TAG]
+
+    def test_stop_without_punctuation_gets_no_tail(self, mock_groq_replies):
+        """Test that text ending without punctuation is left alone unless it was cut off."""
+        calls = mock_groq_replies(("You love loud guitars \u2014", "stop"))
+
+        assert _generate_analysis("prompt") == ("You love loud guitars \u2014", True)
+        assert len(calls) == 1
+
+    def test_cut_off_then_finished(self, mock_groq_replies):
+        """Test that a reply cut off by max_tokens is finished by one tail call."""
+        calls = mock_groq_replies(("You rate guitar songs", "length"), ("above the group.", "stop"))
+
+        assert _generate_analysis("prompt") == ("You rate guitar songs above the group.", True)
+        assert len(calls) == 2
+        assert "You rate guitar songs" in calls[1][0][0]
+        assert calls[1][1]["max_tokens"] == 240
+
+    def test_cut_off_twice(self, mock_groq_replies):
+        """Test that a truncated tail gets one more, shorter attempt and then stops."""
+        calls = mock_groq_replies(
+            ("You rate guitar songs", "length"),
+            ("well above", "length"),
+            ("the group", "length"),
+        )
+
+        assert _generate_analysis("prompt") == ("You rate guitar songs well above the group", True)
+        assert [kwargs["max_tokens"] for _, kwargs in calls] == [1200, 240, 120]
+
+    def test_first_call_error(self, mock_groq_replies):
+        """Test that a failed first call returns the error, flagged as not ok, without a tail call."""
+        calls = mock_groq_replies(_RATE_LIMITED)
+
+        assert _generate_analysis("prompt") == (_RATE_LIMITED[0], False)
+        assert len(calls) == 1
+
+    def test_tail_call_error(self, mock_groq_replies):
+        """Test that a failed tail call keeps the partial text and flags it as not ok."""
+        calls = mock_groq_replies(("You rate guitar songs", "length"), _RATE_LIMITED)
+
+        assert _generate_analysis("prompt") == ("You rate guitar songs", False)
+        assert len(calls) == 2
+
+    def test_strip_analysis_tags(self):
+        """Test that the wrapper tags and surrounding whitespace are removed."""
+        assert _strip_analysis_tags("  <analysis>\nText.</analysis>\n") == "Text."
+
+
+class TestGetTopSong:
+    """Test suite for get_top_song."""
+
+    def test_numeric_columns(self):
+        """Test that the song with the highest mean wins and blanks are skipped."""
+        df = pd.DataFrame(
+            {"Timestamp": ["t1", "t2"], "Email address": ["a@x", "b@x"], "Song A": [8.0, np.nan], "Song B": [7, 8]}
+        )
+
+        assert get_top_song(df) == ("Song A", 8.0)
+
+    def test_text_columns_are_coerced(self):
+        """Test that string scores are parsed and unparseable cells are ignored."""
+        df = pd.DataFrame(
+            {"Timestamp": ["t1", "t2"], "Email address": ["a@x", "b@x"], "Song A": ["6", "x"], "Song B": ["7", ""]}
+        )
+
+        assert get_top_song(df) == ("Song B", 7.0)
+
+    def test_no_ratings_raises(self):
+        """Test that a sheet without any numeric rating is rejected."""
+        df = pd.DataFrame({"Timestamp": ["t1"], "Email address": ["a@x"], "Song A": ["n/a"]})
+
+        with pytest.raises(ValueError):
+            get_top_song(df)
+
+
+class TestTopKIndices:
+    """Test suite for _top_k_indices."""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            pytest.param([2.5, -1.0, 1.0, 2.5, 0.0], id="ties"),
+            pytest.param([np.nan, 3.0, np.nan, 1.0], id="nan-tail"),
+            pytest.param([np.nan, np.nan], id="all-nan"),
+            pytest.param([4.0], id="fewer-than-k"),
+        ],
+    )
+    def test_matches_nlargest(self, values):
+        """Test that the selection and order match DataFrame.nlargest."""
+        expected = pd.DataFrame({"v": values}).nlargest(3, "v").index.tolist()
+
+        assert _top_k_indices(np.asarray(values, dtype=np.float64), 3).tolist() == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,78 +3,146 @@ Tests for load_data module.
 Tests Google Sheets authentication and data fetching.
 """
 
+import json
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 import credentials as creds_module
+import load_data
 from exceptions import CredentialsError
 
 
 class TestGoogleSheetsAuthentication:
     """Test suite for Google Sheets authentication."""
 
-    @patch.dict(os.environ, {"GOOGLE_SHEETS_CREDENTIALS": '{"type": "service_account"}'})
-    @patch("credentials.gspread.service_account_from_dict")
-    def test_authenticate_from_env_json(self, mock_auth):
+    @pytest.fixture(autouse=True)
+    def _auth_env(self, monkeypatch):
+        """Reset the shared client and swap gspread's constructors for plain MagicMocks.
+
+        Attributes are rebound with monkeypatch instead of stacked @patch decorators;
+        each test then sets only the env vars and path checks it cares about.
+        """
+        creds_module.reset_client()
+        self.from_dict = MagicMock()
+        self.from_file = MagicMock()
+        monkeypatch.setattr(creds_module.gspread, "service_account_from_dict", self.from_dict)
+        monkeypatch.setattr(creds_module.gspread, "service_account", self.from_file)
+        monkeypatch.delenv("GOOGLE_SHEETS_CREDENTIALS", raising=False)
+        monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+        yield
+        creds_module.reset_client()
+
+    def test_authenticate_from_env_json(self, monkeypatch):
         """Test authentication using GOOGLE_SHEETS_CREDENTIALS env var."""
-        mock_client = MagicMock()
-        mock_auth.return_value = mock_client
+        monkeypatch.setenv("GOOGLE_SHEETS_CREDENTIALS", '{"type": "service_account"}')
 
         result = creds_module.authenticate()
 
-        assert result == mock_client
-        mock_auth.assert_called_once()
+        assert result == self.from_dict.return_value
+        self.from_dict.assert_called_once()
 
-    @patch.dict(os.environ, {"GOOGLE_APPLICATION_CREDENTIALS": "/path/to/creds.json"})
-    @patch("os.path.exists", return_value=True)
-    @patch("credentials.gspread.service_account")
-    def test_authenticate_from_file_env(self, mock_auth, mock_exists):
+    def test_authenticate_from_file_env(self, monkeypatch):
         """Test authentication using GOOGLE_APPLICATION_CREDENTIALS env var."""
-        mock_client = MagicMock()
-        mock_auth.return_value = mock_client
+        monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "/path/to/creds.json")
+        monkeypatch.setattr(os.path, "exists", lambda path: True)
 
         result = creds_module.authenticate()
 
-        assert result == mock_client
-        mock_auth.assert_called_once()
+        assert result == self.from_file.return_value
+        self.from_file.assert_called_once()
 
-    @patch("os.path.exists", return_value=False)
-    @patch.dict(os.environ, {"GOOGLE_SHEETS_CREDENTIALS": "", "GOOGLE_APPLICATION_CREDENTIALS": ""})
-    def test_authenticate_no_credentials(self, mock_exists):
+    def test_authenticate_no_credentials(self, monkeypatch):
         """Test that CredentialsError is raised when no credentials found."""
+        monkeypatch.setattr(os.path, "exists", lambda path: False)
+
         with pytest.raises(CredentialsError):
             creds_module.authenticate()
 
-    @patch("os.path.exists", return_value=True)
-    @patch("credentials.gspread.service_account")
-    @patch.dict(os.environ, {"GOOGLE_SHEETS_CREDENTIALS": "", "GOOGLE_APPLICATION_CREDENTIALS": ""})
-    def test_authenticate_from_local_file(self, mock_auth, mock_exists):
+    def test_authenticate_from_local_file(self, monkeypatch):
         """Test authentication using local credentials.json."""
-        mock_client = MagicMock()
-        mock_auth.return_value = mock_client
+        monkeypatch.setattr(os.path, "exists", lambda path: True)
 
         result = creds_module.authenticate()
 
-        assert result == mock_client
+        assert result == self.from_file.return_value
+
+    def test_authenticate_reuses_client(self, monkeypatch):
+        """Test that repeated calls reuse one client instead of re-authenticating."""
+        monkeypatch.setenv("GOOGLE_SHEETS_CREDENTIALS", '{"type": "service_account"}')
+
+        first = creds_module.authenticate()
+        second = creds_module.authenticate()
+
+        assert first is second
+        self.from_dict.assert_called_once()
 
 
 class TestFetchData:
     """Test suite for data fetching."""
 
-    @patch("load_data.authenticate")
-    @patch("load_data.pd.DataFrame")
-    def test_fetch_data_2024(self, mock_df, mock_auth):
-        """Test fetching 2024 data (modern format)."""
-        # This requires mocking the gspread client and worksheet
-        # Structure depends on actual implementation
-        pass
-
-    @patch("load_data.authenticate")
-    def test_fetch_data_legacy_year(self, mock_auth):
-        """Test fetching legacy year data (2019/2023)."""
-        pass
+    def test_fetch_data_legacy_year(self, authenticated_client):
+        """Test that legacy years read their year-named tab of the legacy spreadsheet directly."""
+        gc = authenticated_client
+        gc.http_client.request.return_value.content = json.dumps(
+            {"values": [["Timestamp", "Email address", "Song A"], ["2019-12-01", "a@test.com", "9"]]}
+        ).encode()
+
+        df = load_data.fetch_data(2019)
+
+        url = gc.http_client.request.call_args.args[1]
+        assert load_data.extract_id_from_url(load_data.LEGACY_SPREADSHEET_URL) in url
+        assert url.endswith("/values/%272019%27")
+        gc.open.assert_not_called()
+        gc.open_by_url.assert_not_called()
+        assert df["Song A"].tolist() == ["9"]
+
+    def test_fetch_data_2024_coerces_scores(self, authenticated_client):
+        """Test that 2024 rows are built from one values request with numeric song columns."""
+        gc = authenticated_client
+        gc.open.return_value.id = "sheet-id"
+        gc.open.return_value.sheet1.title = "Form Responses 1"
+        gc.http_client.request.return_value.content = json.dumps(
+            {
+                "values": [
+                    ["Timestamp", "Email address", "Song A", "Song B"],
+                    ["2024-01-01", "a@test.com", "8"],
+                    ["2024-01-02", "b@test.com", "7", "x"],
+                ]
+            }
+        ).encode()
+
+        df = load_data.fetch_data(2024)
+
+        assert list(df.columns) == ["Timestamp", "Email address", "Song A", "Song B"]
+        assert df["Song A"].tolist() == [8, 7]
+        assert df["Song B"].isna().all()
+        assert df["Email address"].tolist() == ["a@test.com", "b@test.com"]
+        gc.http_client.request.assert_called_once()
+        assert "sheet-id" in gc.http_client.request.call_args.args[1]
+
+    def test_fetch_data_resolves_spreadsheet_once(self, authenticated_client):
+        """Test that repeated fetches skip the spreadsheet lookup and issue one request each."""
+        gc = authenticated_client
+        gc.open.return_value.id = "sheet-id"
+        gc.open.return_value.sheet1.title = "Sheet1"
+        gc.http_client.request.return_value.content = b'{"values": [["Timestamp", "Email address", "Song A"]]}'
+
+        load_data.fetch_data(2024)
+        load_data.fetch_data(2024)
+
+        gc.open.assert_called_once()
+        assert gc.http_client.request.call_count == 2
+
+    def test_parse_values_pads_ragged_rows(self):
+        """Test that trailing blanks dropped by the Sheets API are restored."""
+        payload = b'{"range": "Sheet1", "values": [["Timestamp", "Email address", "Song A"], ["t", "a@test.com"]]}'
+
+        rows = load_data._parse_values(payload)
+
+        assert rows == [["Timestamp", "Email address", "Song A"], ["t", "a@test.com", ""]]
+        assert load_data._parse_values(b'{"range": "Sheet1"}') == []
 
 
 if __name__ == "__main__":
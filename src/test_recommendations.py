@@ -1,40 +1,22 @@
 """Unit tests for the recommendation function with mocked LLM calls."""
 
-from unittest.mock import patch
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+import llm_implementation
 from llm_implementation import generate_recommendations
 
+# Canned LLM replies shared by the tests below
+_RESP_SUCCESS = """[
+    {"song": "Fred again..", "artist": "", "reason": "Your love for emotional electronic music suggests you'd enjoy Fred's melodic approach."},
+    {"song": "Bicep", "artist": "", "reason": "The energetic yet introspective qualities in your top picks align with Bicep's sound."},
+    {"song": "Melodic Techno", "artist": "", "reason": "Based on the atmospheric production in your favorites, this genre would resonate."}
+]"""
 
-class TestGenerateRecommendations:
-    """Test suite for generate_recommendations function."""
-
-    def test_successful_recommendations(self):
-        """Test successful parsing of valid JSON response."""
-        mock_response = """[
-            {"song": "Fred again..", "artist": "", "reason": "Your love for emotional electronic music suggests you'd enjoy Fred's melodic approach."},
-            {"song": "Bicep", "artist": "", "reason": "The energetic yet introspective qualities in your top picks align with Bicep's sound."},
-            {"song": "Melodic Techno", "artist": "", "reason": "Based on the atmospheric production in your favorites, this genre would resonate."}
-        ]"""
-
-        with patch("llm_implementation.call_groq", return_value=mock_response):
-            top5 = ["Song A", "Song B", "Song C", "Song D", "Song E"]
-            bottom5 = ["Song X", "Song Y", "Song Z", "Song W", "Song V"]
-
-            result = generate_recommendations(top5, bottom5, n=3)
-
-            assert len(result) == 3
-            assert result[0]["song"] == "Fred again.."
-            assert result[0]["artist"] == ""
-            assert "emotional electronic music" in result[0]["reason"]
-
-            assert result[1]["song"] == "Bicep"
-            assert result[2]["song"] == "Melodic Techno"
-
-    def test_json_wrapped_in_markdown(self):
-        """Test extraction of JSON when wrapped in markdown code blocks."""
-        mock_response = """Here are my recommendations:
+_RESP_MARKDOWN = """Here are my recommendations:
 
 ```json
 [
@@ -44,79 +26,266 @@ class TestGenerateRecommendations:
 
 Hope this helps!"""
 
-        with patch("llm_implementation.call_groq", return_value=mock_response):
-            result = generate_recommendations(["Song A"], ["Song B"], n=1)
+_RESP_BRACKETS = """[Note] Picks below:
+[
+    {"song": "Mount Kimbie", "artist": "", "reason": "Bass-heavy [but gentle] \\"post-dubstep\\" textures."}
+]
+Trailing text with a ] bracket."""
+
+_RESP_MALFORMED = "This is not valid JSON at all!"
+
+_RESP_MISSING_FIELDS = """[
+    {"song": "Valid Artist", "artist": "", "reason": "Good reason"},
+    {"song": "Missing Reason", "artist": ""},
+    {"artist": "", "reason": "Missing song field"}
+]"""
+
+_RESP_LIMIT = """[
+    {"song": "Artist 1", "artist": "", "reason": "Reason 1"},
+    {"song": "Artist 2", "artist": "", "reason": "Reason 2"},
+    {"song": "Artist 3", "artist": "", "reason": "Reason 3"},
+    {"song": "Artist 4", "artist": "", "reason": "Reason 4"},
+    {"song": "Artist 5", "artist": "", "reason": "Reason 5"},
+    {"song": "Artist 6", "artist": "", "reason": "Reason 6"}
+]"""
+
+_RESP_TRUNCATED = """```json
+[
+    {"song": "Floating Points", "artist": "", "reason": "Jazz-inflected electronics."},
+    {"song": "Four Tet", "artist": "", "reason": "Cut off mid-sent"""
+
+_RESP_ALMOST_JSON = """[
+    {'song': 'Jon Hopkins', 'artist': '', 'reason': "A true gem, though it's not null of ambition.", 'mainstream': false},
+]"""
+
+_RESP_NON_LIST = '{"song": "Not a list", "artist": "", "reason": "This is an object"}'
+
+_API_ERR = Exception("API Error")
+
+
+def _raise_api_error(*args, **kwargs):
+    raise _API_ERR
 
-            assert len(result) == 1
-            assert result[0]["song"] == "ODESZA"
 
-    def test_empty_top5(self):
-        """Test that empty top5 returns empty list."""
+@pytest.fixture
+def mock_call_groq(monkeypatch):
+    """Rebind llm_implementation.call_groq for one test via monkeypatch.
+
+    The returned setter takes a response string, an exception to raise, or a callable
+    to delegate to, and returns the list of (args, kwargs) the fake was called with.
+    """
+    calls = []
+    # Forget JSON-mode rejections recorded by other tests
+    monkeypatch.setattr(llm_implementation, "_JSON_MODE_UNSUPPORTED", set())
+
+    def _set(response):
+        def fake_call(*args, **kwargs):
+            calls.append((args, kwargs))
+            if isinstance(response, Exception):
+                raise response
+            if callable(response):
+                return response(*args, **kwargs)
+            return response
+
+        monkeypatch.setattr(llm_implementation, "call_groq", fake_call)
+        return calls
+
+    return _set
+
+
+class TestGenerateRecommendations:
+    """Test suite for generate_recommendations function."""
+
+    @pytest.mark.parametrize(
+        ("response", "top5", "n", "expected_songs", "reason_fragment"),
+        [
+            pytest.param(
+                _RESP_SUCCESS,
+                ["Song A", "Song B", "Song C", "Song D", "Song E"],
+                3,
+                ["Fred again..", "Bicep", "Melodic Techno"],
+                "emotional electronic music",
+                id="successful",
+            ),
+            # JSON wrapped in markdown code blocks is still extracted
+            pytest.param(_RESP_MARKDOWN, ["Song A"], 1, ["ODESZA"], None, id="markdown"),
+            # Stray brackets around and inside the JSON don't break extraction
+            pytest.param(_RESP_BRACKETS, ["Song A"], 1, ["Mount Kimbie"], "[but gentle]", id="brackets"),
+            # Unparseable text returns the fallback entry
+            pytest.param(_RESP_MALFORMED, ["Song A"], 5, ["Unable to analyze taste"], "parse", id="malformed"),
+            # Entries missing required fields are filtered out
+            pytest.param(_RESP_MISSING_FIELDS, ["Song A"], 5, ["Valid Artist"], None, id="missing-fields"),
+            # Results are limited to n even if the LLM returns more
+            pytest.param(_RESP_LIMIT, ["Song A"], 3, ["Artist 1", "Artist 2", "Artist 3"], None, id="limit-to-n"),
+            # Almost-JSON (single quotes, trailing comma) is accepted on the lenient retry
+            pytest.param(_RESP_ALMOST_JSON, ["Song A"], 5, ["Jon Hopkins"], "true gem", id="almost-json"),
+            # A reply cut off mid-array keeps the objects that completed
+            pytest.param(_RESP_TRUNCATED, ["Song A"], 5, ["Floating Points"], None, id="truncated"),
+        ],
+    )
+    def test_parse_response(self, mock_call_groq, response, top5, n, expected_songs, reason_fragment):
+        """Test parsing of one canned LLM reply into recommendations."""
+        mock_call_groq(response)
+
+        result = generate_recommendations(top5, ["Song B"], n=n)
+
+        assert [r["song"] for r in result] == expected_songs
+        assert all(r["artist"] == "" for r in result)
+        if reason_fragment:
+            assert reason_fragment in result[0]["reason"].lower()
+
+    def test_empty_top5(self, mock_call_groq):
+        """Test that empty top5 returns empty list without calling the LLM."""
+        calls = mock_call_groq(_RESP_SUCCESS)
+
         result = generate_recommendations([], ["Song X"])
+
         assert not result
+        assert not calls
 
-    def test_malformed_json_returns_fallback(self):
-        """Test fallback when JSON parsing fails."""
-        mock_response = "This is not valid JSON at all!"
-
-        with patch("llm_implementation.call_groq", return_value=mock_response):
-            result = generate_recommendations(["Song A"], ["Song B"])
-
-            assert len(result) == 1
-            assert result[0]["song"] == "Unable to analyze taste"
-            assert "parse" in result[0]["reason"].lower()
-
-    def test_missing_required_fields(self):
-        """Test that recommendations with missing fields are filtered out."""
-        mock_response = """[
-            {"song": "Valid Artist", "artist": "", "reason": "Good reason"},
-            {"song": "Missing Reason", "artist": ""},
-            {"artist": "", "reason": "Missing song field"}
-        ]"""
-
-        with patch("llm_implementation.call_groq", return_value=mock_response):
-            result = generate_recommendations(["Song A"], ["Song B"], n=5)
-
-            # Only the valid one should be returned
-            assert len(result) == 1
-            assert result[0]["song"] == "Valid Artist"
-
-    def test_limit_to_n_recommendations(self):
-        """Test that results are limited to n even if LLM returns more."""
-        mock_response = """[
-            {"song": "Artist 1", "artist": "", "reason": "Reason 1"},
-            {"song": "Artist 2", "artist": "", "reason": "Reason 2"},
-            {"song": "Artist 3", "artist": "", "reason": "Reason 3"},
-            {"song": "Artist 4", "artist": "", "reason": "Reason 4"},
-            {"song": "Artist 5", "artist": "", "reason": "Reason 5"},
-            {"song": "Artist 6", "artist": "", "reason": "Reason 6"}
-        ]"""
-
-        with patch("llm_implementation.call_groq", return_value=mock_response):
-            result = generate_recommendations(["Song A"], ["Song B"], n=3)
-
-            assert len(result) == 3
-            assert result[0]["song"] == "Artist 1"
-            assert result[2]["song"] == "Artist 3"
-
-    def test_exception_handling(self):
+    def test_exception_handling(self, mock_call_groq):
         """Test that exceptions are caught and return error message."""
-        with patch("llm_implementation.call_groq", side_effect=Exception("API Error")):
-            result = generate_recommendations(["Song A"], ["Song B"])
+        mock_call_groq(_raise_api_error)
+
+        result = generate_recommendations(["Song A"], ["Song B"])
+
+        assert len(result) == 1
+        assert "Error generating recommendations" in result[0]["song"]
+        assert "API Error" in result[0]["reason"]
+
+    def test_non_list_response(self, mock_call_groq):
+        """Test handling when the batched prompt returns valid JSON but not a list."""
+
+        def fake_call(prompt, model=None, **kwargs):
+            # JSON-mode single calls fail, forcing the batched fallback
+            return "" if "response_format" in kwargs else _RESP_NON_LIST
+
+        mock_call_groq(fake_call)
+
+        result = generate_recommendations(["Song A"], ["Song B"])
+
+        assert len(result) == 1
+        assert result[0]["song"] == "Unable to analyze taste"
+
+    def test_parallel_single_object_calls(self, mock_call_groq):
+        """Test that JSON-mode calls return one recommendation each, deduplicated, in order."""
+        responses = {
+            "recommendation 1 of 3": '{"song": "Caribou", "artist": "", "reason": "Warm electronics."}',
+            "recommendation 2 of 3": '{"song": "caribou", "artist": "", "reason": "Duplicate pick."}',
+            "recommendation 3 of 3": '{"song": "Shoegaze", "artist": "", "reason": "Hazy guitars."}',
+        }
+
+        def fake_call(prompt, model=None, **kwargs):
+            if "response_format" not in kwargs:
+                # batched top-up finds nothing new
+                return "[]"
+            assert kwargs["response_format"] == {"type": "json_object"}
+            return next(v for k, v in responses.items() if k in prompt)
+
+        calls = mock_call_groq(fake_call)
+
+        result = generate_recommendations(["Song A"], ["Song B"], n=3)
+
+        assert [r["song"] for r in result] == ["Caribou", "Shoegaze"]
+        assert len(calls) == 4
+
+    def test_parallel_shortfall_topped_up_from_batch(self, mock_call_groq):
+        """Test that failed or repeated JSON-mode picks are replaced from the batched prompt."""
+        responses = {
+            "recommendation 1 of 3": '{"song": "Caribou", "artist": "", "reason": "Warm electronics."}',
+            "recommendation 2 of 3": '{"song": "caribou", "artist": "", "reason": "Duplicate pick."}',
+            "recommendation 3 of 3": "Error generating response: 429 Too Many Requests",
+        }
+
+        def fake_call(prompt, model=None, **kwargs):
+            if "response_format" not in kwargs:
+                return _RESP_LIMIT
+            return next(v for k, v in responses.items() if k in prompt)
+
+        calls = mock_call_groq(fake_call)
+
+        result = generate_recommendations(["Song A"], ["Song B"], n=3)
+
+        assert [r["song"] for r in result] == ["Caribou", "Artist 1", "Artist 2"]
+        assert len(calls) == 4
+        batched_prompt = calls[-1][0][0]
+        assert "generate 2 artist or genre recommendations" in batched_prompt
+        assert "- Caribou" in batched_prompt.split("do not suggest any of these again")[1]
+
+    def test_parallel_prompts_exclude_earlier_picks(self, mock_call_groq, monkeypatch):
+        """Test that each JSON-mode prompt lists the picks already made."""
+        picks = iter(["Caribou", "Shoegaze", "Four Tet"])
+
+        def fake_call(prompt, model=None, **kwargs):
+            return json.dumps({"song": next(picks), "artist": "", "reason": "Fits."})
+
+        monkeypatch.setattr(llm_implementation, "RECOMMENDATION_MAX_WORKERS", 1)
+        calls = mock_call_groq(fake_call)
+
+        result = generate_recommendations(["Song A"], ["Song B"], n=3)
+
+        assert [r["song"] for r in result] == ["Caribou", "Shoegaze", "Four Tet"]
+        prompts = [args[0] for args, _ in calls]
+        assert "do not suggest" not in prompts[0]
+        assert "- Caribou" in prompts[1] and "- Shoegaze" not in prompts[1]
+        assert "- Caribou" in prompts[2] and "- Shoegaze" in prompts[2]
+
+    def test_json_mode_rejection_is_remembered(self, mock_call_groq):
+        """Test that after a model rejects JSON mode, later requests go straight to the batched prompt."""
+
+        def fake_call(prompt, model=None, **kwargs):
+            if "response_format" in kwargs:
+                return "Error generating response: 400 response_format json_object is not supported"
+            return _RESP_SUCCESS
+
+        calls = mock_call_groq(fake_call)
+
+        first = generate_recommendations(["Song A"], ["Song B"], n=3)
+        json_calls = sum("response_format" in kwargs for _, kwargs in calls)
+        second = generate_recommendations(["Song A"], ["Song B"], n=3)
+
+        assert [r["song"] for r in first] == [r["song"] for r in second] == ["Fred again..", "Bicep", "Melodic Techno"]
+        assert 1 <= json_calls <= 3
+        assert sum("response_format" in kwargs for _, kwargs in calls) == json_calls
+        assert len(calls) == json_calls + 2
+
+    def test_parallel_picks_kept_when_batch_fails(self, mock_call_groq):
+        """Test that usable JSON-mode picks are returned when the batched fallback is unparseable."""
+
+        def fake_call(prompt, model=None, **kwargs):
+            if "response_format" not in kwargs:
+                return _RESP_MALFORMED
+            if "recommendation 1 of 2" in prompt:
+                return '{"song": "Caribou", "artist": "", "reason": "Warm electronics."}'
+            return ""
+
+        mock_call_groq(fake_call)
+
+        result = generate_recommendations(["Song A"], ["Song B"], n=2)
+
+        assert [r["song"] for r in result] == ["Caribou"]
+
+
+class TestGroqClient:
+    """Test suite for the shared Groq client."""
+
+    def test_concurrent_first_use_builds_one_client(self, monkeypatch):
+        """Test that threads racing on first use all get the same client."""
+        built = []
 
-            assert len(result) == 1
-            assert "Error generating recommendations" in result[0]["song"]
-            assert "API Error" in result[0]["reason"]
+        def fake_groq(**kwargs):
+            time.sleep(0.01)
+            built.append(kwargs)
+            return object()
 
-    def test_non_list_response(self):
-        """Test handling when LLM returns valid JSON but not a list."""
-        mock_response = '{"song": "Not a list", "artist": "", "reason": "This is an object"}'
+        monkeypatch.setattr(llm_implementation, "Groq", fake_groq)
+        monkeypatch.setattr(llm_implementation, "_GROQ_CLIENT", None)
 
-        with patch("llm_implementation.call_groq", return_value=mock_response):
-            result = generate_recommendations(["Song A"], ["Song B"])
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            clients = list(pool.map(lambda _: llm_implementation._get_groq_client(), range(5)))
 
-            assert len(result) == 1
-            assert result[0]["song"] == "Unable to analyze taste"
+        assert len(built) == 1
+        assert all(c is clients[0] for c in clients)
 
 
 if __name__ == "__main__":
@@ -3,21 +3,32 @@ Gradio theme and CSS styling for the music survey app.
 Centralized theme configuration and custom CSS.
 """
 
-from gradio import themes
-
-# Theme configuration
-THEME = themes.Soft(
-    primary_hue="blue",
-    secondary_hue="indigo",
-    neutral_hue="slate",
-    font=themes.GoogleFont("Inter"),
-).set(
-    body_background_fill="*neutral_950",
-    block_title_text_weight="600",
-)
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_theme():
+    """Build the Gradio theme on first use.
+
+    gradio.themes is imported here rather than at module level, so importing this
+    module (e.g. for CUSTOM_CSS) doesn't pay for Gradio's theme construction.
+    """
+    from gradio import themes
 
-# Custom CSS styles
-CUSTOM_CSS = """
+    return themes.Soft(
+        primary_hue="blue",
+        secondary_hue="indigo",
+        neutral_hue="slate",
+        font=themes.GoogleFont("Inter"),
+    ).set(
+        body_background_fill="*neutral_950",
+        block_title_text_weight="600",
+    )
+
+
+# Custom CSS styles (readable source; CUSTOM_CSS below is the minified copy shipped to the browser)
+_CUSTOM_CSS_RAW = """
     .gradio-container {max-width: 1400px !important; margin: 0 auto !important; padding: 0 1rem !important;}
     .hero {text-align: center; padding: 2rem 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
            border-radius: 12px; margin-bottom: 2rem; color: white;}
@@ -75,3 +86,30 @@ CUSTOM_CSS = """
         iframe[data-testid="embed-iframe"] {height: 250px !important;}
     }
 """
+
+# Quoted strings are kept verbatim (attribute selectors match inline styles exactly);
+# comments are dropped, whitespace runs collapse, and spaces around { } ; disappear.
+_CSS_TOKENS = re.compile(
+    r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|(/\*.*?\*/)|(\s*[{};]\s*)|(\s+)""",
+    re.DOTALL,
+)
+
+
+def _minify_css(css: str) -> str:
+    """Return css without comments and redundant whitespace."""
+
+    def _replace(match: re.Match) -> str:
+        quoted, comment, punctuation, _ = match.groups()
+        if quoted:
+            return quoted
+        if comment:
+            return ""
+        if punctuation:
+            return punctuation.strip()
+        return " "
+
+    return _CSS_TOKENS.sub(_replace, css).strip()
+
+
+# Minified once at import
+CUSTOM_CSS = _minify_css(_CUSTOM_CSS_RAW)
@@ -1,9 +1,220 @@
+from functools import wraps
+
 import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import get_colorscale
+
+from cache import CachedDataLoader
+from config import FIGURE_CACHE_MAX_SIZE, FRAME_DIGEST_MEMO_SIZE, SCATTERGL_MIN_POINTS, VOTE_STATS_CACHE_MAX_SIZE
+from settings import settings
+
+try:
+    import orjson  # type: ignore  # noqa: F401
+
+    # Pin figure serialization (fig.to_json, what the UI ships to the browser) to orjson
+    pio.json.config.default_engine = "orjson"
+except Exception:
+    # orjson is optional; plotly falls back to the stdlib json encoder without it
+    pass
+
+# Named scales resolved once; unvalidated figures do not expand names plotly.js lacks (e.g. OrRd)
+_COLORSCALES = {name: get_colorscale(name) for name in ("Viridis", "OrRd", "Greens", "RdYlGn")}
+
+# (frame, digest) for the most recently hashed frame objects, newest last; a dashboard render
+# alternates between df_raw, avg_scores and comparison, so one slot would keep evicting
+_digest_memo: list[tuple[pd.DataFrame, tuple]] = []
+
+# Built figures keyed by builder name and argument contents (see _cached_figure)
+FIGURE_CACHE = CachedDataLoader(
+    ttl_seconds=settings.cache_ttl_seconds,
+    max_size=FIGURE_CACHE_MAX_SIZE,
+)
+
+# Parsed vote matrix and per-song std devs keyed by df_raw contents (see _vote_stats)
+VOTE_STATS_CACHE = CachedDataLoader(
+    ttl_seconds=settings.cache_ttl_seconds,
+    max_size=VOTE_STATS_CACHE_MAX_SIZE,
+)
+
+
+def _frame_digest(df: pd.DataFrame) -> tuple:
+    """Columns, dtypes and a row-hash digest identifying a DataFrame's contents.
+
+    Hashing is O(rows x columns), so digests of the last FRAME_DIGEST_MEMO_SIZE non-empty
+    frame objects are reused. The memo holds the frames themselves, so an id is never recycled
+    while its digest is remembered.
+    """
+    for frame, digest in _digest_memo:
+        if frame is df:
+            return digest
+
+    digest = (
+        tuple(df.columns),
+        tuple(map(str, df.dtypes)),
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes(),
+    )
+    if not df.empty:
+        # empty placeholder frames hash instantly and would only evict real ones
+        _digest_memo.append((df, digest))
+        del _digest_memo[:-FRAME_DIGEST_MEMO_SIZE]
+    return digest
+
+
+def _content_key(value):
+    """Hashable stand-in for a builder argument; DataFrames are keyed by their contents."""
+    if isinstance(value, pd.DataFrame):
+        return _frame_digest(value)
+    return value
+
+
+def _cached_figure(builder):
+    """Serve repeat calls with equal inputs from FIGURE_CACHE instead of rebuilding.
+
+    The cache is shared by every session, so the cached Figure is never handed out: each
+    call gets an unvalidated copy (go.Figure deep-copies the trace and layout dicts) that
+    the caller may update freely. to_dict() is not used because it base64-encodes arrays.
+    """
+
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (
+                builder.__name__,
+                tuple(_content_key(a) for a in args),
+                tuple(sorted((k, _content_key(v)) for k, v in kwargs.items())),
+            )
+            hash(key)
+        except TypeError:
+            # unhashable cell values; build without caching
+            return builder(*args, **kwargs)
+        fig = FIGURE_CACHE.get(key, lambda: builder(*args, **kwargs))
+        return go.Figure({"data": fig._data, "layout": fig._layout}, _validate=False)
+
+    return wrapper
+
+
+def _figure(data: list[dict], layout: dict) -> go.Figure:
+    """Wrap pre-assembled trace and layout dicts in a Figure.
+
+    Builders assemble plain dicts and skip plotly's per-property validate/coerce
+    pass, which dominates construction time for these small charts. Titles must
+    therefore use the explicit {"text": ...} form and arrays should be plain
+    NumPy/list values.
+    """
+    return go.Figure({"data": data, "layout": layout}, _validate=False)
+
+
+def _parse_scores(df_raw: pd.DataFrame) -> np.ndarray:
+    """Song columns of a responses frame as a read-only (voters x songs) float matrix, NaN where unparseable."""
+    block = df_raw.iloc[:, 2:]
+    if all(pd.api.types.is_numeric_dtype(t) for t in block.dtypes):
+        scores = block.to_numpy(dtype=np.float64, copy=True)
+    else:
+        # one to_numeric over the flattened block instead of a per-column loop
+        flat = pd.Series(block.to_numpy().ravel())
+        scores = pd.to_numeric(flat, errors="coerce").to_numpy(dtype=np.float64).reshape(block.shape)
+    scores.flags.writeable = False
+    return scores
+
+
+def _vote_stats(df_raw: pd.DataFrame) -> tuple[np.ndarray, pd.DataFrame]:
+    """Parsed vote matrix and per-song std devs for df_raw, computed once per distinct contents.
+
+    Every builder that reads individual votes goes through here, so one dashboard render
+    parses the sheet once, and sessions holding equal copies of it share the result.
+
+    Returns:
+        (scores, std_devs): the read-only float matrix from _parse_scores and a
+        ['Song', 'Std Dev'] frame of per-song sample standard deviations
+    """
+
+    def compute() -> tuple[np.ndarray, pd.DataFrame]:
+        scores = _parse_scores(df_raw)
+        std = pd.DataFrame(scores).std().to_numpy()
+        return scores, pd.DataFrame({"Song": df_raw.columns[2:], "Std Dev": std})
+
+    return VOTE_STATS_CACHE.get(_frame_digest(df_raw), compute)
+
+
+def _score_matrix(df_raw: pd.DataFrame) -> np.ndarray:
+    """Song columns of df_raw as a shared read-only (voters x songs) float matrix (see _vote_stats)."""
+    return _vote_stats(df_raw)[0]
+
+
+def _all_votes(df_raw: pd.DataFrame) -> np.ndarray:
+    """Every individual numeric vote in df_raw as a flat float32 array (scores are exact in float32)."""
+    votes = _score_matrix(df_raw).ravel()
+    return votes[~np.isnan(votes)].astype(np.float32)
+
+
+def _song_std(df_raw: pd.DataFrame) -> pd.DataFrame:
+    """Per-song sample standard deviation of votes as ['Song', 'Std Dev'] (see _vote_stats)."""
+    return _vote_stats(df_raw)[1]
+
+
+def _by_song(frame: pd.DataFrame, column: str) -> pd.Series:
+    """frame[column] indexed by Song for keyed lookups; a repeated title keeps its first row."""
+    values = frame.set_index("Song")[column]
+    return values[~values.index.duplicated()]
 
 
+def _with_average(std_devs: pd.DataFrame, avg_scores: pd.DataFrame) -> pd.DataFrame:
+    """Attach 'Average Score' to per-song std devs, keeping only songs that have an average.
+
+    Same rows and order as an inner merge on Song, via a keyed lookup instead of a join.
+    """
+    averages = _by_song(avg_scores, "Average Score")
+    ranked = std_devs[std_devs["Song"].isin(averages.index)]
+    return ranked.assign(**{"Average Score": averages.reindex(ranked["Song"]).to_numpy()})
+
+
+def _ascending_by_score(avg_scores: pd.DataFrame) -> pd.DataFrame:
+    """Order avg_scores by ascending 'Average Score' (bars are drawn bottom-up).
+
+    data_utils.compute_scores already returns rows ranked best-first, so reversing that order
+    is enough and skips a sort; anything else is sorted as before.
+    """
+    if avg_scores["Average Score"].is_monotonic_decreasing:
+        return avg_scores.iloc[::-1]
+    return avg_scores.sort_values("Average Score", ascending=True)
+
+
+def _vline(x: float, color: str, width: float, opacity: float | None = None) -> dict:
+    """Dashed full-height vertical line shape at data coordinate x (what fig.add_vline draws)."""
+    shape = dict(
+        type="line",
+        x0=x,
+        x1=x,
+        xref="x",
+        y0=0,
+        y1=1,
+        yref="y domain",
+        line=dict(color=color, dash="dash", width=width),
+    )
+    if opacity is not None:
+        shape["opacity"] = opacity
+    return shape
+
+
+def _vline_label(x: float, text: str, color: str) -> dict:
+    """Annotation pinned to the top-right of a _vline."""
+    return dict(
+        x=x,
+        xref="x",
+        y=1,
+        yref="y domain",
+        xanchor="left",
+        yanchor="top",
+        text=text,
+        showarrow=False,
+        font=dict(family="Inter", size=11, color=color),
+    )
+
+
+@_cached_figure
 def make_main_chart(avg_scores: pd.DataFrame, user_votes: pd.DataFrame | None = None) -> go.Figure:
     """Create the main ranking chart (average bars, optional user overlay).
 
@@ -13,36 +224,39 @@ def make_main_chart(avg_scores: pd.DataFrame, user_votes: pd.DataFrame | None =
     if avg_scores.empty:
         return go.Figure()
 
-    df_plot = avg_scores.sort_values("Average Score", ascending=True)
-
-    fig = go.Figure()
+    df_plot = _ascending_by_score(avg_scores)
+    scores = df_plot["Average Score"].to_numpy()
+    songs = df_plot["Song"].to_numpy()
 
-    # Add average scores
-    fig.add_trace(
-        go.Bar(
-            x=df_plot["Average Score"],
-            y=df_plot["Song"],
+    # Average scores
+    data = [
+        dict(
+            type="bar",
+            x=scores,
+            y=songs,
             orientation="h",
             name="Average Score",
             marker=dict(
-                color=df_plot["Average Score"],
-                colorscale="Viridis",
+                color=scores,
+                colorscale=_COLORSCALES["Viridis"],
                 line=dict(width=0),  # no border
                 showscale=True,
                 colorbar=dict(title=dict(text="Score", font=dict(size=12)), thickness=12, len=0.7),
             ),
             hovertemplate="<b>%{y}</b><br>Rank: #%{customdata}<br>Average Score: %{x:.2f}<extra></extra>",
-            customdata=df_plot["Rank"],
+            customdata=df_plot["Rank"].to_numpy(),
         )
-    )
+    ]
 
     # Add user scores if available
     if user_votes is not None and not user_votes.empty:
-        user_scores = pd.merge(df_plot[["Song"]], user_votes, on="Song", how="left")
-        fig.add_trace(
-            go.Bar(
-                x=user_scores["Your Score"],
-                y=user_scores["Song"],
+        # align the user's scores to the chart's song order (NaN where they did not vote)
+        user_scores = _by_song(user_votes, "Your Score").reindex(songs).to_numpy()
+        data.append(
+            dict(
+                type="bar",
+                x=user_scores,
+                y=songs,
                 orientation="h",
                 name="Your Score",
                 marker=dict(
@@ -54,17 +268,15 @@ def make_main_chart(avg_scores: pd.DataFrame, user_votes: pd.DataFrame | None =
             )
         )
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Complete Song Ranking",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 24, "color": "#1a1a1a", "family": "Inter"},
         },
-        xaxis_title="Average Score",
-        yaxis_title="",
-        xaxis=dict(range=[0, 10.5], showgrid=True, gridcolor="rgba(0,0,0,0.06)"),
-        yaxis=dict(showgrid=False),
+        xaxis=dict(title=dict(text="Average Score"), range=[0, 10.5], showgrid=True, gridcolor="rgba(0,0,0,0.06)"),
+        yaxis=dict(title=dict(text=""), showgrid=False),
         plot_bgcolor="#fff",
         paper_bgcolor="white",
         barmode="overlay",
@@ -74,9 +286,10 @@ def make_main_chart(avg_scores: pd.DataFrame, user_votes: pd.DataFrame | None =
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_main_chart_user_only(comparison: pd.DataFrame | None) -> go.Figure:
     """Create a ranking chart using only the user's scores, sorted by user's ranking.
 
@@ -86,36 +299,35 @@ def make_main_chart_user_only(comparison: pd.DataFrame | None) -> go.Figure:
         return go.Figure()
 
     df_plot = comparison.sort_values("Your Score", ascending=True)
+    scores = df_plot["Your Score"].to_numpy()
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            x=df_plot["Your Score"],
-            y=df_plot["Song"],
+    data = [
+        dict(
+            type="bar",
+            x=scores,
+            y=df_plot["Song"].to_numpy(),
             orientation="h",
             name="Your Score",
             marker=dict(
-                color=df_plot["Your Score"],
-                colorscale="Viridis",
+                color=scores,
+                colorscale=_COLORSCALES["Viridis"],
                 line=dict(width=0),  # no border
                 showscale=True,
                 colorbar=dict(title=dict(text="Your Score", font=dict(size=12)), thickness=12, len=0.7),
             ),
             hovertemplate="<b>%{y}</b><br>Your Score: %{x:.2f}<extra></extra>",
         )
-    )
+    ]
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Your Complete Ranking",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 24, "color": "#1a1a1a", "family": "Inter"},
         },
-        xaxis_title="Your Score",
-        yaxis_title="",
-        xaxis=dict(range=[0, 10.5], showgrid=True, gridcolor="rgba(0,0,0,0.06)"),
-        yaxis=dict(showgrid=False),
+        xaxis=dict(title=dict(text="Your Score"), range=[0, 10.5], showgrid=True, gridcolor="rgba(0,0,0,0.06)"),
+        yaxis=dict(title=dict(text=""), showgrid=False),
         plot_bgcolor="#fff",
         paper_bgcolor="white",
         height=max(600, len(df_plot) * 25),
@@ -123,59 +335,56 @@ def make_main_chart_user_only(comparison: pd.DataFrame | None) -> go.Figure:
         showlegend=False,
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_top_10_spotlight(avg_scores: pd.DataFrame) -> go.Figure:
     """Top-10 chart: outside-left labels show medal, rank, title, and score."""
     if avg_scores.empty:
         return go.Figure()
 
-    top10 = avg_scores.head(10).sort_values("Average Score", ascending=True)
+    top10 = _ascending_by_score(avg_scores.head(10))
+    scores = top10["Average Score"].to_numpy()
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            x=top10["Average Score"],
-            y=top10["Song"],
+    data = [
+        dict(
+            type="bar",
+            x=scores,
+            y=top10["Song"].to_numpy(),
             orientation="h",
-            marker=dict(color=top10["Average Score"], colorscale="Viridis", line=dict(width=0), showscale=False),
-            text=None,
+            marker=dict(color=scores, colorscale=_COLORSCALES["Viridis"], line=dict(width=0), showscale=False),
             hovertemplate="<b>Rank #%{customdata}</b><br>%{y}<br>Score: %{x:.2f}<extra></extra>",
-            customdata=top10["Rank"],
+            customdata=top10["Rank"].to_numpy(),
         )
-    )
+    ]
 
     medal = {1: "🥇", 2: "🥈", 3: "🥉"}
 
-    def label_for_row(row):
-        r = int(row["Rank"])
-        return f"{medal.get(r, '')} #{r}  {row['Song']}  •  {row['Average Score']:.2f}"
-
-    def size_for_rank(r):
-        r = int(r)
-        return 20 if r == 1 else 18 if r == 2 else 16 if r == 3 else 13
+    ranks = top10["Rank"].to_numpy(dtype=int)
+    sizes = np.select([ranks == 1, ranks == 2, ranks == 3], [20, 18, 16], default=13).tolist()
 
-    fig.update_yaxes(showticklabels=False)
-    for _, row in top10.iterrows():
-        fig.add_annotation(
+    annotations = [
+        dict(
             x=0,
             xref="paper",
-            y=row["Song"],
+            y=song,
             yref="y",
-            text=label_for_row(row),
+            text=f"{medal.get(r, '')} #{r}  {song}  •  {score:.2f}",
             showarrow=False,
             xanchor="right",
             xshift=-8,
             align="right",
-            font=dict(size=size_for_rank(row["Rank"]), color="#223"),
+            font=dict(size=size, color="#223"),
         )
+        for r, song, score, size in zip(ranks.tolist(), top10["Song"].tolist(), scores.tolist(), sizes, strict=True)
+    ]
 
     # Full x-axis from 0 to max with margin
     max_score = float(top10["Average Score"].max())
     x_max = min(10.5, round(max_score + 0.5, 2))
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Top 10 Songs",
             "x": 0.5,
@@ -184,45 +393,37 @@ def make_top_10_spotlight(avg_scores: pd.DataFrame) -> go.Figure:
         },
         plot_bgcolor="#fff",
         paper_bgcolor="white",
-        xaxis=dict(range=[0, x_max], title="Average Score", showgrid=True, gridcolor="rgba(0,0,0,0.06)"),
-        yaxis=dict(showgrid=False, title=""),
+        xaxis=dict(range=[0, x_max], title=dict(text="Average Score"), showgrid=True, gridcolor="rgba(0,0,0,0.06)"),
+        yaxis=dict(showgrid=False, title=dict(text=""), showticklabels=False),
         height=500,
         margin=dict(l=550, r=100, t=140, b=60),
         bargap=0.30,
+        annotations=annotations,
     )
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_distribution_chart(avg_scores: pd.DataFrame) -> go.Figure:
     """Histogram of average scores with a vertical line at the overall mean."""
     if avg_scores.empty:
         return go.Figure()
 
-    fig = go.Figure()
-
-    fig.add_trace(
-        go.Histogram(
-            x=avg_scores["Average Score"],
+    data = [
+        dict(
+            type="histogram",
+            x=avg_scores["Average Score"].to_numpy(),
             nbinsx=20,
             marker=dict(color="#667eea", line=dict(width=0)),
             hovertemplate="Score Range: %{x}<br>Songs: %{y}<extra></extra>",
             name="Songs",
         )
-    )
+    ]
 
-    # Add average line
+    # Average line
     avg_score = avg_scores["Average Score"].mean()
-    fig.add_vline(
-        x=avg_score,
-        line_dash="dash",
-        line_color="#e74c3c",
-        line_width=2,
-        annotation_text=f"Average: {avg_score:.2f}",
-        annotation_position="top right",
-        annotation=dict(font=dict(family="Inter", size=11, color="#e74c3c")),
-    )
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Average Score Distribution",
             "x": 0.5,
@@ -232,59 +433,52 @@ def make_distribution_chart(avg_scores: pd.DataFrame) -> go.Figure:
         plot_bgcolor="#f8f9fa",
         paper_bgcolor="white",
         font=dict(family="Inter", color="#2c3e50"),
-        xaxis=dict(title="Average Score", showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False),
+        xaxis=dict(
+            title=dict(text="Average Score"), showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False
+        ),
         yaxis=dict(
-            title="Number of Songs/Votes", showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False
+            title=dict(text="Number of Songs/Votes"),
+            showgrid=True,
+            gridcolor="rgba(0,0,0,0.06)",
+            gridwidth=1,
+            zeroline=False,
         ),
         height=350,
         margin=dict(l=50, r=50, t=0, b=50),
         showlegend=False,
         bargap=0.15,
+        shapes=[_vline(avg_score, "#e74c3c", 2)],
+        annotations=[_vline_label(avg_score, f"Average: {avg_score:.2f}", "#e74c3c")],
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_all_votes_distribution(df_raw: pd.DataFrame | None) -> go.Figure:
     """Histogram of all individual votes (per-song ratings), not averages."""
     if df_raw is None or df_raw.empty or len(df_raw.columns) < 3:
         return go.Figure()
 
-    song_cols = df_raw.columns[2:]
-    all_votes = []
-
-    for col in song_cols:
-        votes = pd.to_numeric(df_raw[col], errors="coerce").dropna()
-        all_votes.extend(votes.tolist())
-
-    if not all_votes:
+    all_votes = _all_votes(df_raw)
+    if not all_votes.size:
         return go.Figure()
 
-    fig = go.Figure()
-
-    fig.add_trace(
-        go.Histogram(
+    data = [
+        dict(
+            type="histogram",
             x=all_votes,
             nbinsx=10,
             marker=dict(color="#a78bfa", line=dict(width=0)),
             hovertemplate="Score: %{x}<br>Count: %{y}<extra></extra>",
             name="Individual Votes",
         )
-    )
+    ]
 
-    # Add average line
-    avg_vote = np.mean(all_votes)
-    fig.add_vline(
-        x=avg_vote,
-        line_dash="dash",
-        line_color="#e74c3c",
-        line_width=2,
-        annotation_text=f"Average: {avg_vote:.2f}",
-        annotation_position="top right",
-        annotation=dict(font=dict(family="Inter", size=11, color="#e74c3c")),
-    )
+    # Average line
+    avg_vote = all_votes.mean(dtype=np.float64)
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "All Individual Votes Distribution",
             "x": 0.5,
@@ -295,7 +489,7 @@ def make_all_votes_distribution(df_raw: pd.DataFrame | None) -> go.Figure:
         paper_bgcolor="white",
         font=dict(family="Inter", color="#2c3e50"),
         xaxis=dict(
-            title="Vote Score (1-10)",
+            title=dict(text="Vote Score (1-10)"),
             range=[0, 11],
             showgrid=True,
             gridcolor="rgba(0,0,0,0.06)",
@@ -303,55 +497,56 @@ def make_all_votes_distribution(df_raw: pd.DataFrame | None) -> go.Figure:
             zeroline=False,
         ),
         yaxis=dict(
-            title="Number of Songs/Votes", showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False
+            title=dict(text="Number of Songs/Votes"),
+            showgrid=True,
+            gridcolor="rgba(0,0,0,0.06)",
+            gridwidth=1,
+            zeroline=False,
         ),
         height=350,
         margin=dict(l=50, r=50, t=80, b=50),
         showlegend=False,
         bargap=0.15,
+        shapes=[_vline(avg_vote, "#e74c3c", 2)],
+        annotations=[_vline_label(avg_vote, f"Average: {avg_vote:.2f}", "#e74c3c")],
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_podium_chart(avg_scores: pd.DataFrame) -> go.Figure:
     """Podium for ranks 1–3; shows all ties, with a smart y-axis band near the top."""
     if avg_scores.empty:
         return go.Figure()
 
-    # Helper: rows for a given rank, sorted nicely
-    def rows_for_rank(r: int) -> pd.DataFrame:
-        rdf = avg_scores[avg_scores["Rank"] == r].copy()
-        if rdf.empty:
-            return rdf
-        return rdf.sort_values(["Average Score", "Song"], ascending=[False, True])
-
     # Visual order: 2nd (left), 1st (center), 3rd (right)
-    order = [
-        (2, "🥈", "#C0C0C0"),
-        (1, "🥇", "#FFD700"),
-        (3, "🥉", "#CD7F32"),
-    ]
+    slot = {2: 0, 1: 1, 3: 2}
+    medal = {1: "🥇", 2: "🥈", 3: "🥉"}
+    color = {1: "#FFD700", 2: "#C0C0C0", 3: "#CD7F32"}
 
-    labels, values, colors, hovers, texts = [], [], [], [], []
-    for r, medal, color in order:
-        r_df = rows_for_rank(r)
-        for _, row in r_df.iterrows():
-            song = str(row["Song"])
-            score = float(row["Average Score"])
-            short = song if len(song) <= 32 else (song[:32] + "…")
-            labels.append(f"{medal} {short}")
-            values.append(score)
-            colors.append(color)
-            hovers.append(f"<b>{song}</b><br>Score: {score:.2f}")
-            texts.append(f"{score:.2f}")
-
-    if not labels:
+    # Ranks 1-3 in podium order, ties sorted nicely within each step
+    podium = avg_scores[avg_scores["Rank"].isin(slot.keys())]
+    podium = podium.assign(_slot=podium["Rank"].map(slot)).sort_values(
+        ["_slot", "Average Score", "Song"], ascending=[True, False, True]
+    )
+    if podium.empty:
         return go.Figure()
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
+    songs = podium["Song"].astype(str)
+    scores = podium["Average Score"].astype(float)
+    texts = scores.map("{:.2f}".format)
+    short = songs.str.slice(0, 32) + np.where(songs.str.len() > 32, "…", "")
+
+    labels = (podium["Rank"].map(medal) + " " + short).to_numpy()
+    values = scores.to_numpy()
+    colors = podium["Rank"].map(color).to_numpy()
+    hovers = ("<b>" + songs + "</b><br>Score: " + texts).to_numpy()
+    texts = texts.to_numpy()
+
+    data = [
+        dict(
+            type="bar",
             x=labels,
             y=values,
             marker=dict(color=colors, line=dict(width=0)),
@@ -362,18 +557,18 @@ def make_podium_chart(avg_scores: pd.DataFrame) -> go.Figure:
             customdata=hovers,
             showlegend=False,
         )
-    )
+    ]
 
     # --- Smart y-axis: zoom into top band, not from zero ---
-    y_lo = min(values)
-    y_hi = max(values)
+    y_lo = float(values.min())
+    y_hi = float(values.max())
     span = max(1e-6, y_hi - y_lo)
     bottom_pad = max(0.5, 0.15 * span)
     top_pad = max(0.6, 0.20 * span)
     y_min = max(0.1, y_lo - bottom_pad)
     y_max = min(10.0, y_hi + top_pad)
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "The Podium",
             "x": 0.5,
@@ -384,7 +579,7 @@ def make_podium_chart(avg_scores: pd.DataFrame) -> go.Figure:
         xaxis=dict(showgrid=False, tickangle=-15, tickfont=dict(size=11)),
         yaxis=dict(
             range=[y_min, y_max],
-            title="Average Score",
+            title=dict(text="Average Score"),
             showgrid=True,
             gridcolor="rgba(0,0,0,0.06)",
             gridwidth=1,
@@ -397,9 +592,10 @@ def make_podium_chart(avg_scores: pd.DataFrame) -> go.Figure:
         bargap=0.35,
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_biggest_disagreements_chart(comparison: pd.DataFrame | None) -> go.Figure:
     """Songs where the user differed most from average (top 10 overrated/underrated)."""
     if comparison is None or comparison.empty:
@@ -407,32 +603,32 @@ def make_biggest_disagreements_chart(comparison: pd.DataFrame | None) -> go.Figu
 
     # Get top 10 most overrated (positive difference) and underrated (negative difference)
     sorted_comp = comparison.sort_values("Difference", ascending=False)
-    top_overrated = sorted_comp.head(10)
-    top_underrated = sorted_comp.tail(10)
+    n = len(sorted_comp)
 
-    # Combine and sort by absolute difference
-    disagreements = pd.concat([top_overrated, top_underrated]).drop_duplicates()
-    disagreements = disagreements.sort_values("Difference", ascending=True)
+    # Combine head and tail positions (they overlap when there are fewer than 20 songs) and sort
+    positions = np.union1d(np.arange(min(10, n)), np.arange(max(n - 10, 0), n))
+    disagreements = sorted_comp.iloc[positions].sort_values("Difference", ascending=True)
 
     # Color coding: red for underrated, green for overrated
-    colors = ["#e74c3c" if diff < 0 else "#2ecc71" for diff in disagreements["Difference"]]
-
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            y=disagreements["Song"],
-            x=disagreements["Difference"],
+    diffs = disagreements["Difference"]
+    colors = np.where(diffs.to_numpy() < 0, "#e74c3c", "#2ecc71")
+
+    data = [
+        dict(
+            type="bar",
+            y=disagreements["Song"].to_numpy(),
+            x=disagreements["Difference"].to_numpy(),
             orientation="h",
             marker=dict(color=colors, line=dict(width=0)),
-            text=[f"{d:+.1f}" for d in disagreements["Difference"]],
+            text=diffs.map("{:+.1f}".format).to_numpy(),
             textposition="outside",
             textfont=dict(family="Inter", size=11),
             hovertemplate="<b>%{y}</b><br>Your Score: %{customdata[0]:.1f}<br>Average: %{customdata[1]:.1f}<br>Difference: %{x:+.1f}<extra></extra>",
-            customdata=disagreements[["Your Score", "Average Score"]].values,
+            customdata=disagreements[["Your Score", "Average Score"]].to_numpy(),
         )
-    )
+    ]
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Your Biggest Disagreements with the Group",
             "x": 0.5,
@@ -441,86 +637,93 @@ def make_biggest_disagreements_chart(comparison: pd.DataFrame | None) -> go.Figu
         },
         font=dict(family="Inter", color="#2c3e50"),
         xaxis=dict(
-            title="Difference from Average (Your Score - Average Score)",
+            title=dict(text="Difference from Average (Your Score - Average Score)"),
             showgrid=True,
             gridcolor="rgba(0,0,0,0.06)",
             gridwidth=1,
             zeroline=False,
         ),
-        yaxis_title="",
+        yaxis=dict(title=dict(text="")),
         plot_bgcolor="#f8f9fa",
         paper_bgcolor="white",
         height=max(450, len(disagreements) * 25),
         margin=dict(l=320, r=30, t=90, b=60),
         showlegend=False,
+        # Vertical line at 0
+        shapes=[_vline(0, "#95a5a6", 1.5, opacity=0.6)],
     )
 
-    # Add vertical line at 0
-    fig.add_vline(x=0, line_dash="dash", line_color="#95a5a6", line_width=1.5, opacity=0.6)
-
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_user_vs_community_top10(comparison: pd.DataFrame | None, avg_scores: pd.DataFrame) -> go.Figure:
     """Side-by-side bars: user's top 10 (right) vs community's top 10 (left)."""
     if comparison is None or comparison.empty:
         return go.Figure()
 
     # Get community top 10
-    community_top10 = avg_scores.head(10).copy()
-    community_top10["Type"] = "Community"
+    community_top10 = avg_scores.head(10)
 
     # Get user's top 10
-    user_top10 = comparison.nlargest(10, "Your Score").copy()
-    user_top10["Type"] = "Your Top 10"
+    user_top10 = comparison.nlargest(10, "Your Score")
 
     # Mark songs that appear in both
-    in_both = set(community_top10["Song"]) & set(user_top10["Song"])
+    community_in_both = community_top10["Song"].isin(user_top10["Song"]).to_numpy()
+    user_in_both = user_top10["Song"].isin(community_top10["Song"]).to_numpy()
 
-    fig = go.Figure()
+    data = []
 
     # Community top 10 (left side, negative x)
-    fig.add_trace(
-        go.Bar(
+    data.append(
+        dict(
+            type="bar",
             name="Community Top 10",
-            y=community_top10["Song"],
-            x=-community_top10["Average Score"],
+            y=community_top10["Song"].to_numpy(),
+            x=-community_top10["Average Score"].to_numpy(),
             orientation="h",
             marker=dict(
-                color=["#FFD700" if song in in_both else "#667eea" for song in community_top10["Song"]],
+                color=np.where(community_in_both, "#FFD700", "#667eea"),
                 line=dict(width=0),
             ),
-            text=[f"{score:.1f}" for score in community_top10["Average Score"]],
+            text=community_top10["Average Score"].map("{:.1f}".format).to_numpy(),
             textposition="inside",
             textfont=dict(family="Inter", size=11, color="white"),
             hovertemplate="<b>%{y}</b><br>Average Score: %{customdata:.2f}<extra></extra>",
-            customdata=community_top10["Average Score"],
+            customdata=community_top10["Average Score"].to_numpy(),
         )
     )
 
     # User top 10 (right side, positive x)
-    fig.add_trace(
-        go.Bar(
+    data.append(
+        dict(
+            type="bar",
             name="Your Top 10",
-            y=user_top10["Song"],
-            x=user_top10["Your Score"],
+            y=user_top10["Song"].to_numpy(),
+            x=user_top10["Your Score"].to_numpy(),
             orientation="h",
-            marker=dict(
-                color=["#FFD700" if song in in_both else "#e74c3c" for song in user_top10["Song"]], line=dict(width=0)
-            ),
-            text=[f"{score:.1f}" for score in user_top10["Your Score"]],
+            marker=dict(color=np.where(user_in_both, "#FFD700", "#e74c3c"), line=dict(width=0)),
+            text=user_top10["Your Score"].map("{:.1f}".format).to_numpy(),
             textposition="inside",
             textfont=dict(family="Inter", size=11, color="white"),
             hovertemplate="<b>%{y}</b><br>Your Score: %{x:.2f}<extra></extra>",
         )
     )
 
-    # Add invisible trace for "In Both" legend entry
-    fig.add_trace(
-        go.Bar(name="In Both Top 10s", x=[0], y=[""], marker=dict(color="#FFD700"), showlegend=True, hoverinfo="skip")
+    # Invisible trace for "In Both" legend entry
+    data.append(
+        dict(
+            type="bar",
+            name="In Both Top 10s",
+            x=[0],
+            y=[""],
+            marker=dict(color="#FFD700"),
+            showlegend=True,
+            hoverinfo="skip",
+        )
     )
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Your Top 10 vs Community Top 10",
             "x": 0.5,
@@ -533,7 +736,7 @@ def make_user_vs_community_top10(comparison: pd.DataFrame | None, avg_scores: pd
         font=dict(family="Inter", color="#2c3e50"),
         barmode="overlay",
         xaxis=dict(
-            title="← Community Score | Your Score →",
+            title=dict(text="← Community Score | Your Score →"),
             range=[-11, 11],
             showgrid=True,
             gridcolor="rgba(0,0,0,0.06)",
@@ -542,7 +745,7 @@ def make_user_vs_community_top10(comparison: pd.DataFrame | None, avg_scores: pd
             zerolinewidth=2,
             zerolinecolor="rgba(0,0,0,0.3)",
         ),
-        yaxis_title="",
+        yaxis=dict(title=dict(text="")),
         plot_bgcolor="#f8f9fa",
         paper_bgcolor="white",
         height=500,
@@ -560,96 +763,93 @@ def make_user_vs_community_top10(comparison: pd.DataFrame | None, avg_scores: pd
         ),
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_voting_heatmap(df_raw: pd.DataFrame | None, email_prefix: str = "") -> go.Figure:
     """Heatmap of all voter-by-song ratings (anonymized), highlights current user if set."""
     if df_raw is None or df_raw.empty or len(df_raw.columns) < 3:
         return go.Figure()
 
-    # Get song columns and voter names
-    song_cols = df_raw.columns[2:]
-    voters_original = df_raw["Email address"].str.split("@").str[0].tolist()
+    # Get voter names
+    voters_original = df_raw["Email address"].str.split("@", n=1).str[0].to_numpy()
 
     # Filter out songs with no votes (all NaN or 0)
-    df_numeric = df_raw[song_cols].apply(pd.to_numeric, errors="coerce")
-    songs_with_votes = df_numeric.columns[(df_numeric > 0).any()]
+    scores = _score_matrix(df_raw)
+    has_votes = np.fmax.reduce(scores, axis=0) > 0  # NaN-skipping column max in one pass, no boolean matrix
 
-    if len(songs_with_votes) == 0:
+    if not has_votes.any():
         return go.Figure()
 
     # Anonymize voters except current user
-    voters = []
-    for i, voter in enumerate(voters_original):
-        if email_prefix and voter == email_prefix:
-            voters.append(voter)  # Keep current user's name
-        else:
-            voters.append(f"Voter {i + 1}")  # Anonymize others
-
-    # Create matrix of scores (only for songs with votes)
-    score_matrix = df_numeric[songs_with_votes].values
-    song_cols = songs_with_votes
-
-    fig = go.Figure(
-        data=go.Heatmap(
+    voters = np.char.add("Voter ", np.arange(1, len(voters_original) + 1).astype(str)).astype(object)
+    if email_prefix:
+        is_user = voters_original == email_prefix
+        voters[is_user] = voters_original[is_user]  # Keep current user's name
+    voters = voters.tolist()
+
+    # Matrix of scores (only for songs with votes); 0-10 votes are exact in float32, halving the payload
+    score_matrix = scores[:, has_votes].astype(np.float32)
+    song_cols = df_raw.columns[2:][has_votes]
+
+    data = [
+        dict(
+            type="heatmap",
             z=score_matrix,
-            x=song_cols,
+            x=song_cols.tolist(),
             y=voters,
-            colorscale="RdYlGn",
+            colorscale=_COLORSCALES["RdYlGn"],
             zmin=0,
             zmax=10,
             hovertemplate="Voter: %{y}<br>Song: %{x}<br>Score: %{z}<extra></extra>",
             colorbar=dict(title=dict(text="Score", font=dict(size=12))),
         )
-    )
+    ]
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "All Votes Heatmap",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 24, "color": "#1a1a1a", "family": "Inter"},
         },
-        xaxis_title="Songs",
-        yaxis_title="Voters",
-        xaxis=dict(tickangle=-45, tickfont=dict(size=9)),
-        yaxis=dict(tickfont=dict(size=10)),
+        xaxis=dict(title=dict(text="Songs"), tickangle=-45, tickfont=dict(size=9)),
+        yaxis=dict(title=dict(text="Voters"), tickfont=dict(size=10)),
         height=max(500, len(voters) * 30),
         margin=dict(l=150, r=100, t=80, b=200),
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_controversy_chart(df_raw: pd.DataFrame | None, avg_scores: pd.DataFrame) -> go.Figure:
     """Top 10 most polarizing songs via highest per-song standard deviation."""
     if df_raw is None or df_raw.empty or len(df_raw.columns) < 3:
         return go.Figure()
 
-    song_cols = df_raw.columns[2:]
-    df_numeric = df_raw[song_cols].apply(pd.to_numeric, errors="coerce")
-
-    # Calculate standard deviation for each song
-    std_devs = df_numeric.std().reset_index()
-    std_devs.columns = ["Song", "Std Dev"]
+    # Standard deviation for each song
+    std_devs = _song_std(df_raw)
 
     # Merge with average scores
-    controversy = pd.merge(std_devs, avg_scores[["Song", "Average Score"]], on="Song")
+    controversy = _with_average(std_devs, avg_scores)
     controversy = controversy.sort_values("Std Dev", ascending=False)
 
     # Top 10 most controversial
     top_controversial = controversy.head(10).sort_values("Std Dev", ascending=True)
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            y=top_controversial["Song"],
-            x=top_controversial["Std Dev"],
+    std = top_controversial["Std Dev"].to_numpy()
+
+    data = [
+        dict(
+            type="bar",
+            y=top_controversial["Song"].to_numpy(),
+            x=std,
             orientation="h",
             marker=dict(
-                color=top_controversial["Std Dev"],
-                colorscale="OrRd",
+                color=std.astype(np.float32),
+                colorscale=_COLORSCALES["OrRd"],
                 line=dict(width=0),
                 showscale=True,
                 colorbar=dict(
@@ -660,15 +860,15 @@ def make_controversy_chart(df_raw: pd.DataFrame | None, avg_scores: pd.DataFrame
                     borderwidth=1,
                 ),
             ),
-            text=[f"{std:.2f}" for std in top_controversial["Std Dev"]],
+            text=top_controversial["Std Dev"].map("{:.2f}".format).to_numpy(),
             textposition="outside",
             textfont=dict(family="Inter", size=11),
             hovertemplate="<b>%{y}</b><br>Average: %{customdata:.2f}<br>Std Dev: %{x:.2f}<br>(Higher = More Polarizing)<extra></extra>",
-            customdata=top_controversial["Average Score"],
+            customdata=top_controversial["Average Score"].to_numpy(),
         )
-    )
+    ]
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Most Polarizing Songs (Highest Vote Variance)",
             "x": 0.5,
@@ -677,13 +877,13 @@ def make_controversy_chart(df_raw: pd.DataFrame | None, avg_scores: pd.DataFrame
         },
         font=dict(family="Inter", color="#2c3e50"),
         xaxis=dict(
-            title="Standard Deviation of Scores",
+            title=dict(text="Standard Deviation of Scores"),
             showgrid=True,
             gridcolor="rgba(0,0,0,0.06)",
             gridwidth=1,
             zeroline=False,
         ),
-        yaxis_title="",
+        yaxis=dict(title=dict(text="")),
         plot_bgcolor="#f8f9fa",
         paper_bgcolor="white",
         height=max(500, len(top_controversial) * 30),
@@ -691,23 +891,20 @@ def make_controversy_chart(df_raw: pd.DataFrame | None, avg_scores: pd.DataFrame
         showlegend=False,
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_most_agreeable_chart(df_raw: pd.DataFrame | None, avg_scores: pd.DataFrame) -> go.Figure:
     """Top 10 most agreeable songs via lowest per-song standard deviation."""
     if df_raw is None or df_raw.empty or len(df_raw.columns) < 3:
         return go.Figure()
 
-    song_cols = df_raw.columns[2:]
-    df_numeric = df_raw[song_cols].apply(pd.to_numeric, errors="coerce")
-
-    # Calculate standard deviation for each song
-    std_devs = df_numeric.std().reset_index()
-    std_devs.columns = ["Song", "Std Dev"]
+    # Standard deviation for each song
+    std_devs = _song_std(df_raw)
 
     # Merge with average scores
-    agreement = pd.merge(std_devs, avg_scores[["Song", "Average Score"]], on="Song")
+    agreement = _with_average(std_devs, avg_scores)
     agreement = agreement.sort_values("Std Dev", ascending=True)
 
     # Top 10 most agreeable (lowest std dev at top)
@@ -717,15 +914,15 @@ def make_most_agreeable_chart(df_raw: pd.DataFrame | None, avg_scores: pd.DataFr
     max_std = top_agreeable["Std Dev"].max()
     inverted_colors = max_std - top_agreeable["Std Dev"]
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            y=top_agreeable["Song"],
-            x=top_agreeable["Std Dev"],
+    data = [
+        dict(
+            type="bar",
+            y=top_agreeable["Song"].to_numpy(),
+            x=top_agreeable["Std Dev"].to_numpy(),
             orientation="h",
             marker=dict(
-                color=inverted_colors,
-                colorscale="Greens",
+                color=inverted_colors.to_numpy(dtype=np.float32),
+                colorscale=_COLORSCALES["Greens"],
                 line=dict(width=0),
                 showscale=True,
                 colorbar=dict(
@@ -747,89 +944,94 @@ def make_most_agreeable_chart(df_raw: pd.DataFrame | None, avg_scores: pd.DataFr
                     ],
                 ),
             ),
-            text=[f"{std:.2f}" for std in top_agreeable["Std Dev"]],
+            text=top_agreeable["Std Dev"].map("{:.2f}".format).to_numpy(),
             textposition="outside",
             hovertemplate="<b>%{y}</b><br>Average: %{customdata:.2f}<br>Std Dev: %{x:.2f}<br>(Lower = More Agreement)<extra></extra>",
-            customdata=top_agreeable["Average Score"],
+            customdata=top_agreeable["Average Score"].to_numpy(),
         )
-    )
+    ]
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Most Agreeable Songs (Lowest Vote Variance)",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 24, "color": "#1a1a1a", "family": "Inter"},
         },
-        xaxis_title="Standard Deviation of Scores",
-        yaxis_title="",
+        # Consistent grid styling
+        xaxis=dict(
+            title=dict(text="Standard Deviation of Scores"),
+            showgrid=True,
+            gridcolor="rgba(0,0,0,0.06)",
+            gridwidth=1,
+            zeroline=False,
+        ),
+        yaxis=dict(title=dict(text="")),
         plot_bgcolor="#fafafa",
         paper_bgcolor="white",
         height=max(500, len(top_agreeable) * 30),
         margin=dict(l=250, r=100, t=80, b=60),
         showlegend=False,
     )
-    # Ensure consistent grid styling
-    fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False)
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_user_rating_pattern(comparison: pd.DataFrame | None, df_raw: pd.DataFrame | None) -> go.Figure:
     """Compare user's vote distribution vs community to infer harsh/generous patterns."""
     if comparison is None or comparison.empty or df_raw is None or df_raw.empty:
         return go.Figure()
 
     # Get all community votes
-    song_cols = df_raw.columns[2:]
-    all_votes = []
-    for col in song_cols:
-        votes = pd.to_numeric(df_raw[col], errors="coerce").dropna()
-        all_votes.extend(votes.tolist())
+    all_votes = _all_votes(df_raw)
 
     # Get user votes
-    user_votes = comparison["Your Score"].dropna().tolist()
+    user_votes = comparison["Your Score"].to_numpy(dtype=np.float32, na_value=np.nan)
+    user_votes = user_votes[~np.isnan(user_votes)]
 
-    if not user_votes or not all_votes:
+    if not user_votes.size or not all_votes.size:
         return go.Figure()
 
-    fig = go.Figure()
-
-    # Community distribution
-    fig.add_trace(
-        go.Histogram(
-            x=all_votes, name="Community", opacity=0.6, nbinsx=10, marker=dict(color="#4A90E2"), histnorm="probability"
-        )
-    )
-
-    # User distribution
-    fig.add_trace(
-        go.Histogram(
+    data = [
+        # Community distribution
+        dict(
+            type="histogram",
+            x=all_votes,
+            name="Community",
+            opacity=0.6,
+            nbinsx=10,
+            marker=dict(color="#4A90E2"),
+            histnorm="probability",
+        ),
+        # User distribution
+        dict(
+            type="histogram",
             x=user_votes,
             name="Your Votes",
             opacity=0.6,
             nbinsx=10,
             marker=dict(color="#E74C3C"),
             histnorm="probability",
-        )
-    )
+        ),
+    ]
 
     # Calculate stats
-    user_avg = np.mean(user_votes)
-    community_avg = np.mean(all_votes)
+    user_avg = user_votes.mean(dtype=np.float64)
+    community_avg = all_votes.mean(dtype=np.float64)
     diff = user_avg - community_avg
 
     rating_type = "Generous Rater" if diff > 0.5 else "Harsh Critic" if diff < -0.5 else "Balanced Rater"
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": f"Your Voting Pattern: {rating_type}",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 24, "color": "#1a1a1a", "family": "Inter"},
         },
-        xaxis_title="Score",
-        yaxis_title="Proportion of Votes",
+        xaxis=dict(title=dict(text="Score")),
+        yaxis=dict(title=dict(text="Proportion of Votes")),
         plot_bgcolor="#fafafa",
         paper_bgcolor="white",
         barmode="overlay",
@@ -849,17 +1051,18 @@ def make_user_rating_pattern(comparison: pd.DataFrame | None, df_raw: pd.DataFra
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
     )
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_taste_similarity_chart(similarity_df: pd.DataFrame | None) -> go.Figure:
     """Show voters with most similar taste (correlation scores, anonymized)."""
     if similarity_df is None or similarity_df.empty:
         return go.Figure()
 
     # Show top 10 most similar and anonymize names
-    top_similar = similarity_df.head(10).copy()
-    top_similar["Voter"] = [f"Similar Voter {i + 1}" for i in range(len(top_similar))]
+    top_similar = similarity_df.head(10)
+    top_similar = top_similar.assign(Voter=[f"Similar Voter {i + 1}" for i in range(len(top_similar))])
     top_similar = top_similar.sort_values("Similarity Score", ascending=True)
 
     # Color coding: green for high correlation, yellow for medium
@@ -868,30 +1071,36 @@ def make_taste_similarity_chart(similarity_df: pd.DataFrame | None) -> go.Figure
         for score in top_similar["Similarity Score"]
     ]
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            y=top_similar["Voter"],
-            x=top_similar["Similarity Score"],
+    data = [
+        dict(
+            type="bar",
+            y=top_similar["Voter"].to_numpy(),
+            x=top_similar["Similarity Score"].to_numpy(),
             orientation="h",
             marker=dict(color=colors, line=dict(width=0)),
-            text=[f"{score:.2f}" for score in top_similar["Similarity Score"]],
+            text=top_similar["Similarity Score"].map("{:.2f}".format).to_numpy(),
             textposition="outside",
             hovertemplate="<b>%{y}</b><br>Similarity: %{x:.2f}<br>Songs in Common: %{customdata}<extra></extra>",
-            customdata=top_similar["Songs in Common"],
+            customdata=top_similar["Songs in Common"].to_numpy(),
         )
-    )
+    ]
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Your Taste Twins (Most Similar Voters)",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 24, "color": "#1a1a1a", "family": "Inter"},
         },
-        xaxis_title="Similarity Score (Correlation)",
-        xaxis=dict(range=[0, 1], showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False),
-        yaxis_title="",
+        xaxis=dict(
+            title=dict(text="Similarity Score (Correlation)"),
+            range=[0, 1],
+            showgrid=True,
+            gridcolor="rgba(0,0,0,0.06)",
+            gridwidth=1,
+            zeroline=False,
+        ),
+        yaxis=dict(title=dict(text="")),
         plot_bgcolor="#fafafa",
         paper_bgcolor="white",
         height=max(400, len(top_similar) * 40),
@@ -899,86 +1108,114 @@ def make_taste_similarity_chart(similarity_df: pd.DataFrame | None) -> go.Figure
         showlegend=False,
     )
 
-    return fig
-
-
+    return _figure(data, layout)
+
+
+# Static parts of the taste-map traces; only type, coordinates and names change per call.
+# Figures copy their input, so these dicts are shared by every build and never mutated.
+_OTHERS_TRACE_TEMPLATE = {
+    "mode": "markers",
+    "marker": {"size": 10, "color": "#4A90E2", "line": {"color": "rgba(0,0,0,0.25)", "width": 2}},
+    "name": "Other Voters",
+    "hovertemplate": "<b>%{customdata}</b><br>X: %{x:.2f}<br>Y: %{y:.2f}<extra></extra>",
+}
+# "You" label is drawn as a layout annotation (see _USER_LABEL_FONT) rather than trace text
+_USER_TRACE_TEMPLATE = {
+    "mode": "markers",
+    "marker": {"size": 18, "color": "#E74C3C", "symbol": "star", "line": {"color": "#FFD700", "width": 3}},
+    "name": "You",
+    "hovertemplate": "<b>%{customdata} (You)</b><br>X: %{x:.2f}<br>Y: %{y:.2f}<extra></extra>",
+}
+_USER_LABEL_FONT = {"size": 12, "color": "#E74C3C"}
+
+
+# Taste-map layout never varies with the data, so it is built once and shared by every figure.
+# Grid lines and closest-point hover are already the defaults and are not repeated here.
+_TASTE_MAP_LAYOUT = {
+    "title": {
+        "text": "2D Taste Map",
+        "x": 0.5,
+        "xanchor": "center",
+        "font": {"size": 24, "color": "#1a1a1a", "family": "Inter"},
+    },
+    "xaxis": {
+        "title": {"text": "Taste Dimension 1", "font": {"color": "#2c3e50"}},
+        "gridcolor": "rgba(0,0,0,0.06)",
+        "zeroline": False,
+        "color": "#2c3e50",
+    },
+    "yaxis": {
+        "title": {"text": "Taste Dimension 2", "font": {"color": "#2c3e50"}},
+        "gridcolor": "rgba(0,0,0,0.06)",
+        "zeroline": False,
+        "color": "#2c3e50",
+    },
+    "plot_bgcolor": "#ffffff",
+    "paper_bgcolor": "#ffffff",
+    "height": 400,
+    "margin": {"l": 80, "r": 80, "t": 80, "b": 60},
+    "showlegend": True,
+    "legend": {
+        "orientation": "h",
+        "yanchor": "bottom",
+        "y": 1.02,
+        "xanchor": "center",
+        "x": 0.5,
+        "font": {"color": "#2c3e50"},
+    },
+}
+
+
+@_cached_figure
 def make_2d_taste_map_chart(taste_map_df: pd.DataFrame | None) -> go.Figure:
     """Interactive 2D scatter of voter taste positions (anonymized and highlighted for current user)."""
     if taste_map_df is None or taste_map_df.empty:
         return go.Figure()
 
     # Separate current user from others and anonymize
-    others = taste_map_df[~taste_map_df["Is_Current_User"]].copy()
+    others = taste_map_df[~taste_map_df["Is_Current_User"]]
     current_user = taste_map_df[taste_map_df["Is_Current_User"]]
 
     # Anonymize other voters
-    others["Voter"] = [f"Voter {i + 1}" for i in range(len(others))]
+    others = others.assign(Voter=[f"Voter {i + 1}" for i in range(len(others))])
+
+    # Large maps render through WebGL; both traces share one renderer so "You" stays on top
+    scatter_type = "scattergl" if len(taste_map_df) > SCATTERGL_MIN_POINTS else "scatter"
+
+    # Coordinates ship as float32 typed arrays; hover shows two decimals so the precision is ample
 
-    fig = go.Figure()
+    data = []
 
-    # Add other voters (without text labels)
+    # Other voters (without text labels)
     if not others.empty:
-        fig.add_trace(
-            go.Scatter(
-                x=others["X"],
-                y=others["Y"],
-                mode="markers",
-                marker=dict(size=10, color="#4A90E2", line=dict(color="rgba(0,0,0,0.25)", width=2)),
-                name="Other Voters",
-                hovertemplate="<b>%{customdata}</b><br>X: %{x:.2f}<br>Y: %{y:.2f}<extra></extra>",
-                customdata=others["Voter"],
-            )
+        data.append(
+            {
+                **_OTHERS_TRACE_TEMPLATE,
+                "type": scatter_type,
+                "x": others["X"].to_numpy(dtype=np.float32),
+                "y": others["Y"].to_numpy(dtype=np.float32),
+                "customdata": others["Voter"].to_numpy(),
+            }
         )
 
-    # Add current user (highlighted)
-    if not current_user.empty:
-        fig.add_trace(
-            go.Scatter(
-                x=current_user["X"],
-                y=current_user["Y"],
-                mode="markers+text",
-                marker=dict(size=18, color="#E74C3C", symbol="star", line=dict(color="#FFD700", width=3)),
-                text=current_user["Voter"],
-                textposition="top center",
-                textfont=dict(size=12, color="#E74C3C"),
-                name="You",
-                hovertemplate="<b>%{text} (You)</b><br>X: %{x:.2f}<br>Y: %{y:.2f}<extra></extra>",
-            )
-        )
+    # Current user (highlighted)
+    if current_user.empty:
+        return _figure(data, _TASTE_MAP_LAYOUT)
 
-    fig.update_layout(
-        title={
-            "text": "2D Taste Map",
-            "x": 0.5,
-            "xanchor": "center",
-            "font": {"size": 24, "color": "#1a1a1a", "family": "Inter"},
-        },
-        xaxis=dict(
-            title=dict(text="Taste Dimension 1", font=dict(color="#2c3e50")),
-            showgrid=True,
-            gridcolor="rgba(0,0,0,0.06)",
-            zeroline=False,
-            color="#2c3e50",
-        ),
-        yaxis=dict(
-            title=dict(text="Taste Dimension 2", font=dict(color="#2c3e50")),
-            showgrid=True,
-            gridcolor="rgba(0,0,0,0.06)",
-            zeroline=False,
-            color="#2c3e50",
-        ),
-        plot_bgcolor="#ffffff",
-        paper_bgcolor="#ffffff",
-        height=400,
-        margin=dict(l=80, r=80, t=80, b=60),
-        hovermode="closest",
-        showlegend=True,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(color="#2c3e50")),
-    )
+    user_x = current_user["X"].to_numpy(dtype=np.float32)
+    user_y = current_user["Y"].to_numpy(dtype=np.float32)
+    user_names = current_user["Voter"].to_numpy()
+    data.append({**_USER_TRACE_TEMPLATE, "type": scatter_type, "x": user_x, "y": user_y, "customdata": user_names})
 
-    return fig
+    # Name label above the star, laid out once instead of as a per-trace text layer
+    annotations = [
+        {"x": x, "y": y, "text": str(name), "yshift": 14, "showarrow": False, "font": _USER_LABEL_FONT}
+        for x, y, name in zip(user_x.tolist(), user_y.tolist(), user_names, strict=True)
+    ]
+    return _figure(data, {**_TASTE_MAP_LAYOUT, "annotations": annotations})
 
 
+@_cached_figure
 def make_song_clustering_chart(song_clusters_df: pd.DataFrame | None, avg_scores: pd.DataFrame) -> go.Figure:
     """Visualize song clusters with average scores."""
     if song_clusters_df is None or song_clusters_df.empty:
@@ -993,33 +1230,37 @@ def make_song_clustering_chart(song_clusters_df: pd.DataFrame | None, avg_scores
     color_palette = px.colors.qualitative.Set3
     cluster_colors = {name: color_palette[i % len(color_palette)] for i, name in enumerate(unique_clusters)}
 
-    fig = go.Figure()
+    data = []
 
     for cluster_name in unique_clusters:
         cluster_data = merged[merged["Cluster_Name"] == cluster_name]
 
-        fig.add_trace(
-            go.Bar(
-                y=cluster_data["Song"],
-                x=cluster_data["Average Score"],
+        data.append(
+            dict(
+                type="bar",
+                y=cluster_data["Song"].to_numpy(),
+                x=cluster_data["Average Score"].to_numpy(),
                 orientation="h",
                 name=cluster_name,
                 marker=dict(color=cluster_colors[cluster_name], line=dict(width=0)),
-                text=[f"{score:.1f}" for score in cluster_data["Average Score"]],
+                text=cluster_data["Average Score"].map("{:.1f}".format).to_numpy(),
                 textposition="outside",
                 hovertemplate="<b>%{y}</b><br>Cluster: " + cluster_name + "<br>Score: %{x:.2f}<extra></extra>",
             )
         )
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Song Clusters: Groups with Similar Voting Patterns",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 20, "color": "#2c3e50"},
         },
-        xaxis_title="Average Score",
-        yaxis_title="",
+        # Consistent grid styling for bars
+        xaxis=dict(
+            title=dict(text="Average Score"), showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False
+        ),
+        yaxis=dict(title=dict(text="")),
         plot_bgcolor="#fafafa",
         paper_bgcolor="white",
         height=max(600, len(merged) * 20),
@@ -1028,12 +1269,11 @@ def make_song_clustering_chart(song_clusters_df: pd.DataFrame | None, avg_scores
         showlegend=True,
         legend=dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.02),
     )
-    # Consistent grid styling for bars
-    fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False)
 
-    return fig
+    return _figure(data, layout)
 
 
+@_cached_figure
 def make_voter_clustering_chart(voter_clusters_df: pd.DataFrame | None) -> go.Figure:
     """Visualize voter clusters as a bar chart showing distribution."""
     if voter_clusters_df is None or voter_clusters_df.empty:
@@ -1047,35 +1287,39 @@ def make_voter_clustering_chart(voter_clusters_df: pd.DataFrame | None) -> go.Fi
     color_palette = px.colors.qualitative.Pastel
     colors = [color_palette[i % len(color_palette)] for i in cluster_counts["Cluster"]]
 
-    fig = go.Figure()
-
-    fig.add_trace(
-        go.Bar(
-            y=cluster_counts["Cluster_Name"],
-            x=cluster_counts["Count"],
+    data = [
+        dict(
+            type="bar",
+            y=cluster_counts["Cluster_Name"].to_numpy(),
+            x=cluster_counts["Count"].to_numpy(),
             orientation="h",
             marker=dict(color=colors, line=dict(width=0)),
-            text=cluster_counts["Count"],
+            text=cluster_counts["Count"].to_numpy(),
             textposition="outside",
             hovertemplate="<b>%{y}</b><br>Voters: %{x}<extra></extra>",
             showlegend=False,
         )
-    )
+    ]
 
-    fig.update_layout(
+    layout = dict(
         title={
             "text": "Voter Archetypes: Taste Groups",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 20, "color": "#2c3e50"},
         },
-        xaxis_title="Number of Voters",
-        yaxis_title="",
+        xaxis=dict(
+            title=dict(text="Number of Voters"),
+            showgrid=True,
+            gridcolor="rgba(0,0,0,0.06)",
+            gridwidth=1,
+            zeroline=False,
+        ),
+        yaxis=dict(title=dict(text="")),
         plot_bgcolor="#fafafa",
         paper_bgcolor="white",
         height=max(400, len(cluster_counts) * 60),
         margin=dict(l=200, r=100, t=80, b=60),
     )
-    fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.06)", gridwidth=1, zeroline=False)
 
-    return fig
+    return _figure(data, layout)